@@ -0,0 +1,121 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CConsoleWriter.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CConsoleWriter`` contains an asynchronous console output for the keywords of the ``Collection`` library.
+"""
+
+import sys, queue, threading
+
+from robot.utils import console_encode
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CConsoleWriter(object):
+   """
+The class ``CConsoleWriter`` writes text to the console within a background thread.
+
+The text is put into a bounded queue (FIFO; therefore the order of the output is preserved) and is written by the
+background thread. All text that is already queued, is written with one single write and one single flush.
+In case of the queue is full, ``Write`` waits until the background thread has processed enough text.
+
+The class is also a listener (listener API version 3) that flushes the queue at the end of every test and every suite.
+   """
+
+   ROBOT_LISTENER_API_VERSION = 3
+
+   def __init__(self, nQueueSize=10000):
+      self.oQueue  = queue.Queue(maxsize=nQueueSize)
+      self.oThread = None # started with the first output
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _Run(self):
+      """
+Main function of the background thread.
+      """
+      while True:
+         listTexts = [self.oQueue.get()]
+         try:
+            while True:
+               listTexts.append(self.oQueue.get_nowait())
+         except queue.Empty:
+            pass
+         try:
+            oStream = sys.__stdout__
+            if oStream is not None:
+               oStream.write(console_encode("".join(listTexts), stream=oStream))
+               oStream.flush()
+         except Exception:
+            pass # console output must not break the test execution
+         finally:
+            for _ in listTexts:
+               self.oQueue.task_done()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Write(self, sText=None):
+      """
+Queues ``sText`` (followed by a newline) for the console output.
+      """
+      if self.oThread is None:
+         self.oThread = threading.Thread(target=self._Run, name="CConsoleWriter", daemon=True)
+         self.oThread.start()
+      self.oQueue.put(f"{sText}\n")
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Flush(self):
+      """
+Waits until all queued text is written to the console.
+      """
+      if self.oThread is not None:
+         self.oQueue.join()
+
+   # --------------------------------------------------------------------------------------------------------------
+   # listener interface
+
+   def end_test(self, data, result):
+      self.Flush()
+
+   def end_suite(self, data, result):
+      self.Flush()
+
+   def close(self):
+      self.Flush()
+
+# eof class CConsoleWriter(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,208 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CKeywordMetadata.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+
+"""
+The module ``CKeywordMetadata`` contains the keyword metadata of the ``Collection`` library (names, argument specifications, types,
+documentation), computed once at build time and shipped as package data (``Collection.keywords.json``). The library provides this
+metadata by the dynamic library API; loading the library (and libdoc) does not need to introspect the keyword methods.
+
+Command line (executed by the setup of this package):
+
+.. code::
+
+   python -m RobotframeworkExtensions.CKeywordMetadata
+"""
+
+import os, json
+from hashlib import blake2b
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# name of the metadata file (located next to the source file of the library)
+#
+METADATA_FILE = "Collection.keywords.json"
+
+# metadata already loaded (per metadata file; shared by all instances of the library)
+dictLoaded = {}
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetSourceDigest(sSourceFile=None):
+   """
+Returns the hash of the source file of the library; metadata computed out of another version of the source file is outdated.
+   """
+   with open(sSourceFile, "rb") as oFile:
+      return blake2b(oFile.read(), digest_size=16).hexdigest()
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def _GetArguments(oMethod):
+   """
+Returns the argument specification of ``oMethod`` in the format of the dynamic library API (``self`` excluded):
+names of required arguments, ``[name, default]`` of optional arguments, ``*varargs``, ``**kwargs``.
+Additionally the types of all annotated arguments are returned (name -> name of the type).
+   """
+   import inspect
+   listArguments = []
+   dictTypes     = {}
+   bKeywordOnly  = False
+   for oParameter in list(inspect.signature(oMethod).parameters.values())[1:]:
+      if oParameter.annotation is not inspect.Parameter.empty:
+         dictTypes[oParameter.name] = getattr(oParameter.annotation, "__name__", str(oParameter.annotation))
+      if oParameter.kind == inspect.Parameter.VAR_POSITIONAL:
+         listArguments.append(f"*{oParameter.name}")
+         bKeywordOnly = True
+         continue
+      if oParameter.kind == inspect.Parameter.VAR_KEYWORD:
+         listArguments.append(f"**{oParameter.name}")
+         continue
+      if (oParameter.kind == inspect.Parameter.KEYWORD_ONLY) and (bKeywordOnly is False):
+         listArguments.append("*")
+         bKeywordOnly = True
+      if oParameter.default is inspect.Parameter.empty:
+         listArguments.append(oParameter.name)
+      else:
+         listArguments.append([oParameter.name, oParameter.default])
+   return listArguments, dictTypes
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def _GetLineNumber(oMethod):
+   """
+Returns the line number of the definition of ``oMethod`` (decorators skipped).
+   """
+   import linecache
+   oCode       = oMethod.__code__
+   nLineNumber = oCode.co_firstlineno # the line of the first decorator
+   while linecache.getline(oCode.co_filename, nLineNumber).lstrip().startswith("@"):
+      nLineNumber = nLineNumber + 1
+   return nLineNumber
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetKeywordMetadata(oLibraryClass=None, sSourceFile=None):
+   """
+Computes the keyword metadata of ``oLibraryClass`` by introspection: all methods decorated with ``@keyword``.
+
+**Arguments:**
+
+* ``oLibraryClass``
+
+  / *Condition*: required / *Type*: class /
+
+  The library
+
+* ``sSourceFile``
+
+  / *Condition*: required / *Type*: str /
+
+  The source file of the library (the hash of this file identifies the version of the metadata)
+
+**Returns:**
+
+* ``dictMetadata``
+
+  / *Type*: dict /
+
+  ``digest`` (see ``GetSourceDigest``), ``intro`` and ``init`` (documentation of the library and of the library import),
+  ``keywords`` (keyword name -> ``method``, ``args``, ``types``, ``doc``, ``lineno``)
+   """
+   import inspect
+   from robot.utils import printable_name
+   dictKeywords = {}
+   for sName in dir(oLibraryClass):
+      oMethod = getattr(oLibraryClass, sName)
+      if not hasattr(oMethod, "robot_name"):
+         continue
+      listArguments, dictTypes = _GetArguments(oMethod)
+      sKeywordName = oMethod.robot_name or printable_name(sName, code_style=True)
+      dictKeywords[sKeywordName] = {"method" : sName,
+                                    "args"   : listArguments,
+                                    "types"  : dictTypes,
+                                    "doc"    : inspect.getdoc(oMethod) or "",
+                                    "lineno" : _GetLineNumber(oMethod)}
+   return {"digest"   : GetSourceDigest(sSourceFile),
+           "intro"    : inspect.getdoc(oLibraryClass) or "",
+           "init"     : inspect.getdoc(oLibraryClass.__init__) or "",
+           "keywords" : dictKeywords}
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def WriteKeywordMetadata(oLibraryClass=None, sSourceFile=None, sMetadataFile=None):
+   """
+Computes the keyword metadata of ``oLibraryClass`` (see ``GetKeywordMetadata``) and writes it to ``sMetadataFile`` (JSON).
+   """
+   dictMetadata = GetKeywordMetadata(oLibraryClass, sSourceFile)
+   with open(sMetadataFile, "w", encoding="utf-8") as oFile:
+      json.dump(dictMetadata, oFile, indent=1)
+   return dictMetadata
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def LoadKeywordMetadata(oLibraryClass=None, sSourceFile=None, sMetadataFile=None):
+   """
+Returns the keyword metadata of ``oLibraryClass``: read from ``sMetadataFile``, computed by introspection in case of
+the file does not exist or is outdated (the source file has been changed after the file has been written).
+The metadata is loaded once per process.
+
+The arguments with default values are provided as tuples (as required by the dynamic library API).
+   """
+   dictMetadata = dictLoaded.get(sMetadataFile)
+   if dictMetadata is not None:
+      return dictMetadata
+   try:
+      with open(sMetadataFile, "r", encoding="utf-8") as oFile:
+         dictMetadata = json.load(oFile)
+      if dictMetadata.get("digest") != GetSourceDigest(sSourceFile):
+         dictMetadata = None
+   except (OSError, ValueError):
+      dictMetadata = None
+   if dictMetadata is None:
+      dictMetadata = GetKeywordMetadata(oLibraryClass, sSourceFile)
+   for dictKeyword in dictMetadata["keywords"].values():
+      dictKeyword["args"] = [tuple(oArgument) if isinstance(oArgument, list) else oArgument for oArgument in dictKeyword["args"]]
+   dictLoaded[sMetadataFile] = dictMetadata
+   return dictMetadata
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+if __name__ == "__main__":
+   from RobotframeworkExtensions import Collection
+   sMetadataFile = os.path.join(os.path.dirname(os.path.abspath(Collection.__file__)), METADATA_FILE)
+   dictMetadata  = WriteKeywordMetadata(Collection.Collection, Collection.__file__, sMetadataFile)
+   print(f"Keyword metadata of {len(dictMetadata['keywords'])} keywords written to '{sMetadataFile}'")
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,199 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CKeywordProfiler.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+
+"""
+The module ``CKeywordProfiler`` contains the profiling listener of the ``Collection`` library (CPU time and memory allocations
+of keywords).
+"""
+
+import os, re, fnmatch, cProfile, tracemalloc
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# characters not allowed within the names of the profiling files
+#
+regexFileNameCharacters = re.compile(r"[^\w.-]+")
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def NormalizeKeywordName(sName=None):
+   """
+Returns the name ``sName`` of a keyword normalized in the same way like the Robot Framework is doing (case, spaces and underscores
+are not relevant).
+   """
+   return str(sName).lower().replace(" ", "").replace("_", "")
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CKeywordProfiler(object):
+   """
+The class ``CKeywordProfiler`` is a listener (listener API version 3) that profiles selected keywords - of all libraries and
+user keywords - with ``cProfile`` (CPU time) and ``tracemalloc`` (memory allocations).
+
+Profiling is active during the selected keywords only (in case of selected keywords are nested, from the start to the end of
+the outer keyword). The results are collected per test (keywords of suite setups and suite teardowns: per suite) and written
+to the folder ``sProfileDir``:
+
+* ``<test>.prof``: ``cProfile`` statistics (e.g. for ``python -m pstats`` or ``snakeviz``),
+* ``<test>.alloc.txt``: number of calls and peak memory per keyword and the ``nTop`` source lines with the most memory allocated
+  (and not freed again) during the keywords.
+   """
+
+   ROBOT_LISTENER_API_VERSION = 3
+
+   def __init__(self, sProfileDir=None, listPatterns=None, nTop=10):
+      self.sProfileDir     = sProfileDir
+      self.listPatterns    = [NormalizeKeywordName(sPattern) for sPattern in (listPatterns or ["*"])]
+      self.nTop            = nTop
+      self.sScope          = None  # name of the test (or suite setup/teardown) the collected data belongs to
+      self.nDepth          = 0     # > 0: a selected keyword is running (nesting depth of keywords)
+      self.bStopTracing    = False # tracemalloc is started by this listener (and has to be stopped again)
+      self.oProfile        = None  # profile of the current scope
+      self.dictKeywords    = {}    # keyword name -> [calls, peak memory] (current scope)
+      self.dictAllocations = {}    # (file name, line number) -> [size, count] (current scope)
+      self.listFiles       = []    # profiling files written so far
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def IsSelected(self, sName=None, sFullName=None):
+      """
+Returns ``True``, if the keyword ``sName`` (or ``sFullName``: name including library or resource) matches one of the patterns.
+      """
+      sName     = NormalizeKeywordName(sName)
+      sFullName = NormalizeKeywordName(sFullName)
+      for sPattern in self.listPatterns:
+         if fnmatch.fnmatchcase(sName, sPattern) or fnmatch.fnmatchcase(sFullName, sPattern):
+            return True
+      return False
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _Start(self):
+      """
+Starts profiling (start of a selected keyword).
+      """
+      if self.oProfile is None:
+         self.oProfile = cProfile.Profile()
+      self.bStopTracing = tracemalloc.is_tracing() is False
+      if self.bStopTracing is True:
+         tracemalloc.start()
+      tracemalloc.reset_peak()
+      try:
+         self.oProfile.enable()
+      except ValueError:
+         pass # another profiler is already active (e.g. the complete execution is profiled); memory allocations only
+
+   def _Stop(self, sKeyword=None):
+      """
+Stops profiling (end of a selected keyword) and adds the allocations to the results of the current scope.
+      """
+      self.oProfile.disable()
+      _, nPeak = tracemalloc.get_traced_memory()
+      oSnapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__),
+                                                             tracemalloc.Filter(False, __file__)])
+      if self.bStopTracing is True:
+         tracemalloc.stop()
+      listEntry = self.dictKeywords.setdefault(sKeyword, [0, 0])
+      listEntry[0] = listEntry[0] + 1
+      listEntry[1] = max(listEntry[1], nPeak)
+      for oStatistic in oSnapshot.statistics("lineno"):
+         oFrame = oStatistic.traceback[0]
+         listEntry = self.dictAllocations.setdefault((oFrame.filename, oFrame.lineno), [0, 0])
+         listEntry[0] = listEntry[0] + oStatistic.size
+         listEntry[1] = listEntry[1] + oStatistic.count
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Flush(self, sScope=None):
+      """
+Writes the results of the current scope (if any) and starts the new scope ``sScope``.
+      """
+      if (self.oProfile is not None) and (len(self.dictKeywords) > 0):
+         os.makedirs(self.sProfileDir, exist_ok=True)
+         sFile = os.path.join(self.sProfileDir, regexFileNameCharacters.sub("_", self.sScope))
+         self.oProfile.dump_stats(f"{sFile}.prof")
+         listLines = [f"Profiled keywords of '{self.sScope}'", "",
+                      f"{'keyword':<50} | {'calls':>8} | {'peak [KiB]':>12}"]
+         for sKeyword, (nCalls, nPeak) in sorted(self.dictKeywords.items(), key=lambda tupleItem: -tupleItem[1][1]):
+            listLines.append(f"{sKeyword:<50} | {nCalls:>8} | {nPeak / 1024:>12.1f}")
+         listLines.extend(["", f"Top {self.nTop} allocations (not freed at the end of the keywords)", "",
+                           f"{'size [KiB]':>12} | {'count':>8} | location"])
+         listAllocations = sorted(self.dictAllocations.items(), key=lambda tupleItem: -tupleItem[1][0])[:self.nTop]
+         for (sFileName, nLineNumber), (nSize, nCount) in listAllocations:
+            listLines.append(f"{nSize / 1024:>12.1f} | {nCount:>8} | {sFileName}:{nLineNumber}")
+         with open(f"{sFile}.alloc.txt", "w", encoding="utf-8") as oFile:
+            oFile.write("\n".join(listLines) + "\n")
+         self.listFiles.append(f"{sFile}.prof")
+      self.sScope          = sScope
+      self.oProfile        = None
+      self.dictKeywords    = {}
+      self.dictAllocations = {}
+
+   # --------------------------------------------------------------------------------------------------------------
+   # listener interface
+
+   def start_suite(self, data, result):
+      self.Flush(f"{result.full_name}.setup")
+
+   def end_suite(self, data, result):
+      self.Flush(f"{result.parent.full_name}.teardown" if result.parent is not None else None)
+
+   def start_test(self, data, result):
+      self.Flush(result.full_name)
+
+   def end_test(self, data, result):
+      self.Flush(f"{result.parent.full_name}.teardown")
+
+   def start_keyword(self, data, result):
+      if self.nDepth > 0:
+         self.nDepth = self.nDepth + 1
+      elif self.IsSelected(result.name, result.full_name) is True:
+         self.nDepth = 1
+         self._Start()
+
+   def end_keyword(self, data, result):
+      if self.nDepth > 0:
+         self.nDepth = self.nDepth - 1
+         if self.nDepth == 0:
+            self._Stop(result.full_name)
+
+   def close(self):
+      self.Flush(None)
+
+# eof class CKeywordProfiler(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,207 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CKeywordTimer.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+
+"""
+The module ``CKeywordTimer`` contains the timing instrumentation of the keywords of the ``Collection`` library.
+"""
+
+import os, json, time, functools
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# resolution of the histogram of the durations: 2 ** (HISTOGRAM_BITS - 1) buckets per power of two (relative error of
+# the 95th percentile less than 2 ** -HISTOGRAM_BITS)
+#
+HISTOGRAM_BITS = 5
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetBucket(nDuration=0):
+   """
+Returns the bucket of the histogram of the durations containing ``nDuration`` (logarithmic buckets; durations below
+``2 ** HISTOGRAM_BITS`` have buckets of their own).
+   """
+   nShift = nDuration.bit_length() - HISTOGRAM_BITS
+   if nShift <= 0:
+      return nDuration
+   return (nShift << (HISTOGRAM_BITS - 1)) + (nDuration >> nShift)
+
+def GetBucketValue(nBucket=0):
+   """
+Returns the mean value of the durations of the bucket ``nBucket`` (see ``GetBucket``).
+   """
+   nShift = (nBucket >> (HISTOGRAM_BITS - 1)) - 1
+   if nShift <= 0:
+      return nBucket
+   nMantissa = nBucket - (nShift << (HISTOGRAM_BITS - 1))
+   return (nMantissa << nShift) + (1 << (nShift - 1))
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CKeywordTimer(object):
+   """
+The class ``CKeywordTimer`` measures the calls of keywords: number of calls, total, minimum, maximum and 95th percentile
+of the duration (monotonic clock ``time.perf_counter_ns``) and number of characters logged by the keywords.
+
+The keywords are measured by wrappers (see ``Wrap``) - the keywords of libraries without instrumentation are not changed
+and therefore do not have any overhead.
+
+The class is also a listener (listener API version 3) that writes the report (JSON) when the library goes out of scope
+(end of the execution). With a shared state (see ``CSharedState``) additionally the combined report of all processes is written
+(see ``WriteCombinedReport``).
+   """
+
+   ROBOT_LISTENER_API_VERSION = 3
+
+   def __init__(self, sReportFile=None):
+      self.sReportFile  = sReportFile
+      self.dictKeywords = {} # keyword name -> [calls, total, minimum, maximum, characters logged, histogram] (durations in nanoseconds;
+                             # histogram: bucket -> number of calls)
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Record(self, sKeyword=None, nDuration=0, nBytes=0):
+      """
+Adds one call of the keyword ``sKeyword`` with the duration ``nDuration`` (nanoseconds) and ``nBytes`` characters logged.
+      """
+      listEntry = self.dictKeywords.get(sKeyword)
+      if listEntry is None:
+         listEntry = self.dictKeywords[sKeyword] = [0, 0, nDuration, nDuration, 0, {}]
+      listEntry[0] = listEntry[0] + 1
+      listEntry[1] = listEntry[1] + nDuration
+      if nDuration < listEntry[2]:
+         listEntry[2] = nDuration
+      if nDuration > listEntry[3]:
+         listEntry[3] = nDuration
+      listEntry[4] = listEntry[4] + nBytes
+      dictHistogram = listEntry[5]
+      nBucket = GetBucket(nDuration)
+      dictHistogram[nBucket] = dictHistogram.get(nBucket, 0) + 1
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Wrap(self, sKeyword=None, oMethod=None, oGetBytes=None):
+      """
+Returns a wrapper of the keyword method ``oMethod`` that records every call as keyword ``sKeyword``.
+``oGetBytes`` returns the number of characters logged so far (the difference before and after the call is recorded).
+
+The wrapper keeps name, documentation and signature of ``oMethod`` (required by the Robot Framework to identify the keyword
+and its arguments).
+      """
+      oClock = time.perf_counter_ns
+
+      @functools.wraps(oMethod)
+      def TimedKeyword(*args, **kwargs):
+         nBytes = oGetBytes()
+         nStart = oClock()
+         try:
+            return oMethod(*args, **kwargs)
+         finally:
+            self.Record(sKeyword, oClock() - nStart, oGetBytes() - nBytes)
+
+      return TimedKeyword
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetReport(self, dictKeywords=None):
+      """
+Returns the report as dictionary: keyword name -> number of calls, total, minimum, maximum, mean value and 95th percentile
+(nearest rank; mean value of the histogram bucket, within minimum and maximum) of the durations in milliseconds, and
+number of characters logged.
+
+``dictKeywords``: measured values to be reported (default: the values of this process).
+      """
+      if dictKeywords is None:
+         dictKeywords = self.dictKeywords
+      dictReport = {}
+      for sKeyword, (nCalls, nTotal, nMin, nMax, nBytes, dictHistogram) in sorted(dictKeywords.items()):
+         nRank  = max(-(-95 * nCalls // 100), 1)
+         nCount = 0
+         for nBucket in sorted(dictHistogram):
+            nCount = nCount + dictHistogram[nBucket]
+            if nCount >= nRank:
+               break
+         nP95 = min(max(GetBucketValue(nBucket), nMin), nMax)
+         dictReport[sKeyword] = {"calls"        : nCalls,
+                                 "total_ms"     : nTotal / 1e6,
+                                 "min_ms"       : nMin / 1e6,
+                                 "max_ms"       : nMax / 1e6,
+                                 "mean_ms"      : nTotal / nCalls / 1e6,
+                                 "p95_ms"       : nP95 / 1e6,
+                                 "bytes_logged" : nBytes}
+      return dictReport
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _WriteJson(self, sFile=None, dictContent=None):
+      """
+Writes ``dictContent`` to the file ``sFile`` (JSON).
+      """
+      os.makedirs(os.path.dirname(os.path.abspath(sFile)), exist_ok=True)
+      with open(sFile, "w", encoding="utf-8") as oFile:
+         json.dump(dictContent, oFile, indent=2)
+
+   def WriteReport(self):
+      """
+Writes the report (see ``GetReport``) to the file ``sReportFile`` (JSON). Returns the path and name of the file.
+      """
+      if self.sReportFile is None:
+         return None
+      self._WriteJson(self.sReportFile, {"clock" : "time.perf_counter_ns", "keywords" : self.GetReport()})
+      return self.sReportFile
+
+   def WriteCombinedReport(self, oSharedState=None, sReportFile=None):
+      """
+Stores the measured values of this process in the shared state ``oSharedState`` and writes the combined report of all processes
+of this test execution stored so far to the file ``sReportFile``. The report is written while the shared state is locked
+(processes finishing at the same time are serialized; the last process writes the complete report).
+      """
+      def WriteCombined(dictKeywords, nProcesses):
+         self._WriteJson(sReportFile, {"clock" : "time.perf_counter_ns", "processes" : nProcesses, "keywords" : self.GetReport(dictKeywords)})
+      oSharedState.StoreKeywordTiming(self.dictKeywords, WriteCombined)
+      return sReportFile
+
+   # --------------------------------------------------------------------------------------------------------------
+   # listener interface
+
+   def close(self):
+      self.WriteReport()
+
+# eof class CKeywordTimer(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,195 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPathCache.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CPathCache`` contains the cache behind the ``normalize_path`` keyword.
+"""
+
+import os, re
+from collections import OrderedDict
+
+from RobotframeworkExtensions.CPathNormalizer import CPathNormalizer, dictReferencePaths
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# names of environment variables within a path: $NAME, ${NAME} (Linux notation) and %NAME% (Windows notation)
+#
+regexEnvVars = re.compile(r"\$(\w+)|\$\{([^}]*)\}|%([^%]*)%")
+
+# path normalization engines: name -> function (both with the same arguments and with the same results);
+# the PythonExtensionsCollection is imported with the first usage of the 'cstring' engine only (see 'GetPathEngine')
+dictPathEngines = {"native"  : CPathNormalizer.NormalizePath,
+                   "cstring" : None}
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetPathEngine(sEngine=None):
+   """
+Returns the function of the path normalization engine ``sEngine``. Raises ``ValueError`` in case of the engine is unknown.
+   """
+   if sEngine not in dictPathEngines:
+      raise ValueError(f"Invalid path engine '{sEngine}'. Expected one of: {', '.join(dictPathEngines)}")
+   oNormalizePath = dictPathEngines[sEngine]
+   if oNormalizePath is None:
+      from PythonExtensionsCollection.String.CString import CString
+      oNormalizePath = dictPathEngines[sEngine] = CString.NormalizePath
+   return oNormalizePath
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CPathCache(object):
+   """
+The class ``CPathCache`` caches the results of the path normalization engines (LRU, ``nCacheSize`` entries):
+``native`` (``CPathNormalizer.NormalizePath``) or ``cstring`` (``CString.NormalizePath``, PythonExtensionsCollection).
+
+The key of an entry consists of all arguments of ``NormalizePath``, of the engine and of the current working directory (relative paths
+are normalized relative to it). In case of environment variables are expanded, an entry also contains the values
+of all environment variables referenced within the path. An entry is only used, if these values are unchanged;
+otherwise the path is normalized again (invalidation).
+
+With ``oSharedState`` (see ``CSharedState``) the entries stored by other processes before are loaded at the start (not decoded;
+looked up in case of the path is not cached by this process), and the entries used by this process are stored at the end of the process
+(the shared state keeps the most recently used entries).
+   """
+
+   def __init__(self, nCacheSize=1000, oSharedState=None):
+      self.nCacheSize     = nCacheSize
+      self.dictCache      = OrderedDict() # key -> (values of the referenced environment variables, normalized path)
+      self.nHits          = 0
+      self.nMisses        = 0
+      self.nInvalidations = 0
+      self.oSharedState   = oSharedState
+      self.dictShared     = {}    # entries loaded from the shared state: repr(key) -> (repr(values of the environment variables), normalized path)
+      self.setUsedKeys    = set() # keys of the entries added or taken from the shared state by this process (shared state only)
+      self.nSharedHits    = 0
+      if (oSharedState is not None) and (nCacheSize > 0):
+         self.dictShared = oSharedState.LoadPathCache(nCacheSize)
+         oSharedState.AddCloseHandler(self.StoreSharedEntries)
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _GetEnvVarValues(self, sPath):
+      """
+Returns the current values of all environment variables referenced within ``sPath`` (``None`` for undefined variables).
+      """
+      return tuple(os.environ.get(sName1 or sName2 or sName3) for sName1, sName2, sName3 in regexEnvVars.findall(sPath))
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def NormalizePath(self, sPath=None, bWin=False, sReferencePathAbs=None, bConsiderBlanks=False, bExpandEnvVars=True, bMask=True, sEngine="native"):
+      """
+Returns the result of the engine ``sEngine`` (same arguments as ``CString.NormalizePath``) - out of the cache, if possible.
+      """
+      oNormalizePath = GetPathEngine(sEngine)
+      if (sPath is None) or (self.nCacheSize <= 0):
+         return oNormalizePath(sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask)
+
+      tupleKey = (sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask, sEngine, os.getcwd())
+      tupleEnvVarValues = self._GetEnvVarValues(sPath) if bExpandEnvVars is True else ()
+      tupleEntry = self.dictCache.get(tupleKey)
+      if tupleEntry is not None:
+         if tupleEntry[0] == tupleEnvVarValues:
+            self.dictCache.move_to_end(tupleKey)
+            self.nHits = self.nHits + 1
+            return tupleEntry[1]
+         self.nInvalidations = self.nInvalidations + 1
+      elif len(self.dictShared) > 0:
+         tupleShared = self.dictShared.get(repr(tupleKey))
+         if (tupleShared is not None) and (tupleShared[0] == repr(tupleEnvVarValues)):
+            self.nSharedHits = self.nSharedHits + 1
+            self._Add(tupleKey, tupleEnvVarValues, tupleShared[1])
+            self.setUsedKeys.add(tupleKey)
+            return tupleShared[1]
+      self.nMisses = self.nMisses + 1
+
+      sNormalizedPath = oNormalizePath(sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask)
+      self._Add(tupleKey, tupleEnvVarValues, sNormalizedPath)
+      if self.oSharedState is not None:
+         self.setUsedKeys.add(tupleKey)
+      return sNormalizedPath
+
+   def _Add(self, tupleKey, tupleEnvVarValues, sNormalizedPath):
+      """
+Adds an entry to the cache (the least recently used entry is removed, if the cache is full).
+      """
+      self.dictCache[tupleKey] = (tupleEnvVarValues, sNormalizedPath)
+      self.dictCache.move_to_end(tupleKey)
+      if len(self.dictCache) > self.nCacheSize:
+         self.dictCache.popitem(last=False)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def RegisterReferencePath(self, sReferencePathAbs=None):
+      """
+Pre-normalizes the reference path ``sReferencePathAbs`` for the ``native`` engine. Returns ``True``, if relative paths can be joined
+with the pre-normalized reference path; ``False``, if they are joined and normalized together with the reference path (no root).
+      """
+      return CPathNormalizer.GetReferencePath(sReferencePathAbs) is not None
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def StoreSharedEntries(self):
+      """
+Stores the entries used by this process (and still cached) in the shared state.
+      """
+      listEntries = []
+      for tupleKey in self.setUsedKeys:
+         tupleEntry = self.dictCache.get(tupleKey)
+         if tupleEntry is not None:
+            listEntries.append((repr(tupleKey), repr(tupleEntry[0]), tupleEntry[1]))
+      self.oSharedState.StorePathCache(listEntries, self.nCacheSize)
+      self.setUsedKeys = set()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetStatistics(self):
+      """
+Returns the statistics of the cache as dictionary.
+      """
+      return {"hits"          : self.nHits,
+              "misses"        : self.nMisses,
+              "invalidations" : self.nInvalidations,
+              "entries"       : len(self.dictCache),
+              "size"          : self.nCacheSize,
+              "references"    : len(dictReferencePaths),
+              "shared"        : len(self.dictShared),
+              "shared_hits"   : self.nSharedHits}
+
+# eof class CPathCache(object):
+
+# --------------------------------------------------------------------------------------------------------------
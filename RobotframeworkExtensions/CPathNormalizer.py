@@ -0,0 +1,233 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CPathNormalizer.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CPathNormalizer`` contains the native path normalization engine of the ``normalize_path`` keyword.
+"""
+
+import os, re, ntpath, posixpath
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# constant values, computed once (instead of once per path)
+#
+bWindows = os.name == "nt" # same as 'platform.system() == "Windows"' (without importing 'platform')
+
+# environment variables in Linux notation at the beginning of a path (converted to Windows notation under Windows)
+regexEnvVar = re.compile(r"^\$\{(\w+?)\}")
+
+# drive letters (e.g. 'C:'); reference paths with a drive letter and a slash are pre-normalized (root 'C:/')
+regexDrive = re.compile(r"^[A-Za-z]:")
+
+# prefixes of local network resources and internet addresses: prefix -> (remaining path starts at, new prefix (bWin is False),
+# new prefix (bWin is True), bWin overruled by False, bMask overruled by False)
+listPrefixes = [("\\\\",       2,  "//",         "\\\\",       False, True),
+                ("//",         2,  "//",         "\\\\",       False, True),
+                ("file://///", 10, "file://///", "file://///", True,  True),
+                ("http://",    7,  "http://",    "http://",    True,  True),
+                ("http:\\\\",  7,  "http://",    "http://",    True,  True),
+                ("https://",   8,  "https://",   "https://",   True,  True),
+                ("https:\\\\", 8,  "https://",   "https://",   True,  True)]
+
+# first characters of these prefixes (paths starting with other characters are local paths)
+sPrefixCharacters = "\\/fh"
+
+# pre-normalized reference paths: reference path -> (root, list of parts) or None (reference path without root, e.g. relative
+# paths and network resources: the relative path is joined and normalized together with the reference path)
+dictReferencePaths = {}
+
+# maximum number of pre-normalized reference paths (the dictionary is cleared, if exceeded)
+REFERENCE_PATHS_MAX = 1000
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CPathNormalizer(object):
+   """
+The class ``CPathNormalizer`` normalizes paths with the same results as ``CString.NormalizePath`` (PythonExtensionsCollection),
+but with less computation time per path:
+
+* Constant values (platform, regular expressions) are computed once.
+* Environment variables are only expanded in case of the path contains variables.
+* Reference paths (``sReferencePathAbs``) are normalized once. Relative paths are normalized on their own and joined with
+  the pre-normalized reference path (leading up-level references remove parts of the reference path).
+* Local paths without drive (the usual paths under Linux, relative paths, the paths behind the prefixes of local network
+  resources and internet addresses) are normalized by a fast path (one split, one join). All other paths are normalized
+  by ``ntpath.normpath`` - also paths with any character followed by ``:`` at the beginning (e.g. ``/:x``), that are
+  drives for ``ntpath``.
+   """
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   @staticmethod
+   def _NormPath(sPath):
+      """
+Returns the same result as ``ntpath.normpath(sPath).replace("\\\\", "/")``.
+      """
+      sPath = sPath.replace("\\", "/")
+      if (sPath[:2] == "//") or (sPath[1:2] == ":"):
+         return ntpath.normpath(sPath).replace("\\", "/") # UNC paths, drives (for 'ntpath' any character followed by ':', e.g. '/:')
+      bRoot = sPath[:1] == "/"
+      listParts = []
+      for sPart in sPath.split("/"):
+         if (sPart == "") or (sPart == "."):
+            continue
+         if sPart == "..":
+            if (len(listParts) > 0) and (listParts[-1] != ".."):
+               listParts.pop()
+               continue
+            if bRoot is True:
+               continue # no up-level reference above the root
+         listParts.append(sPart)
+      if bRoot is True:
+         return "/" + "/".join(listParts)
+      if len(listParts) == 0:
+         return "."
+      return "/".join(listParts)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   @staticmethod
+   def GetReferencePath(sReferencePathAbs=None):
+      """
+Returns the pre-normalized form of the reference path ``sReferencePathAbs``: a tuple of the root (``/`` or drive letter with
+slash, e.g. ``C:/``) and the list of the remaining parts - or ``None`` in case of the reference path has no such root.
+The result is computed once per reference path.
+      """
+      if sReferencePathAbs in dictReferencePaths:
+         return dictReferencePaths[sReferencePathAbs]
+      tupleReferencePath = None
+      sReferencePath = CPathNormalizer._NormPath(sReferencePathAbs)
+      if (sReferencePath[:1] == "/") and (sReferencePath[1:2] != "/") and (sReferencePath[1:2] != ":"):
+         tupleReferencePath = ("/", [sPart for sPart in sReferencePath[1:].split("/") if sPart != ""])
+      elif (regexDrive.match(sReferencePath) is not None) and (sReferencePath[2:3] == "/"):
+         tupleReferencePath = (sReferencePath[:3], [sPart for sPart in sReferencePath[3:].split("/") if sPart != ""])
+      if len(dictReferencePaths) >= REFERENCE_PATHS_MAX:
+         dictReferencePaths.clear()
+      dictReferencePaths[sReferencePathAbs] = tupleReferencePath
+      return tupleReferencePath
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   @staticmethod
+   def _JoinReferencePath(tupleReferencePath, sPath):
+      """
+Returns the same result as ``_NormPath(os.path.join(sReferencePathAbs, sPath))`` for the pre-normalized reference path
+``tupleReferencePath`` and the relative path ``sPath`` - without normalizing the reference path again.
+      """
+      sRoot, listReferenceParts = tupleReferencePath
+      nUp = 0
+      listParts = []
+      for sPart in sPath.replace("\\", "/").split("/"):
+         if (sPart == "") or (sPart == "."):
+            continue
+         if sPart == "..":
+            if len(listParts) > 0:
+               listParts.pop()
+            else:
+               nUp = nUp + 1
+            continue
+         listParts.append(sPart)
+      if nUp > 0:
+         listParts = listReferenceParts[:max(len(listReferenceParts) - nUp, 0)] + listParts # no up-level reference above the root
+      else:
+         listParts = listReferenceParts + listParts
+      return sRoot + "/".join(listParts)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   @staticmethod
+   def NormalizePath(sPath=None, bWin=False, sReferencePathAbs=None, bConsiderBlanks=False, bExpandEnvVars=True, bMask=True):
+      """
+Normalizes local paths, paths to local network resources and internet addresses.
+
+Arguments and result are the same as the ones of ``CString.NormalizePath`` (see keyword ``normalize_path``).
+      """
+      if sPath is None:
+         return None
+
+      sPath = sPath.strip(" \t\r\n").strip("\"'").strip(" \t")
+      if sPath == "":
+         return sPath
+      sPath = sPath.rstrip("/\\")
+
+      if (bExpandEnvVars is True) and ( ("$" in sPath) or ("%" in sPath) ):
+         if bWindows is True:
+            for sEnvVar in regexEnvVar.findall(sPath):
+               sPath = sPath.replace("${" + sEnvVar + "}", "%" + sEnvVar + "%")
+         sPath = os.path.expandvars(sPath)
+
+      sPathPrefix = None
+      bNormalized = False
+      for sPrefix, nStart, sPrefixLinux, sPrefixWin, bOverruleWin, bOverruleMask in (listPrefixes if sPath[0] in sPrefixCharacters else ()):
+         if sPath.startswith(sPrefix):
+            sPath = sPath[nStart:]
+            sPathPrefix = sPrefixWin if bWin is True else sPrefixLinux
+            if bOverruleWin is True:
+               bWin = False
+               sPathPrefix = sPrefixLinux
+            if bOverruleMask is True:
+               bMask = False
+            break
+      else:
+         if (sPath[0] != "%") and (sPath[0] != "$") and (os.path.isabs(sPath) is False):
+            if sReferencePathAbs is not None:
+               tupleReferencePath = CPathNormalizer.GetReferencePath(sReferencePathAbs) if ":" not in sPath else None
+               if (tupleReferencePath is not None) and (len(tupleReferencePath[1]) == 0):
+                  tupleReferencePath = None # joined with a root only reference path (e.g. '\\') the result may start like a network resource ('//')
+               if tupleReferencePath is not None:
+                  sPath = CPathNormalizer._JoinReferencePath(tupleReferencePath, sPath)
+                  bNormalized = True
+               else:
+                  sPath = os.path.join(sReferencePathAbs, sPath)
+            elif bWindows is True:
+               sPath = os.path.abspath(sPath)
+            else:
+               sPath = posixpath.normpath(posixpath.join(os.getcwd(), sPath)) # same as 'os.path.abspath', without type checks
+               bNormalized = "\\" not in sPath # nothing left to be normalized by '_NormPath'
+
+      if bNormalized is False:
+         sPath = CPathNormalizer._NormPath(sPath)
+      if bWin is True:
+         sPath = sPath.replace("/", "\\\\" if bMask is True else "\\")
+
+      if sPathPrefix is not None:
+         sPath = sPathPrefix + sPath
+
+      if (bConsiderBlanks is True) and (" " in sPath):
+         sPath = f"\"{sPath}\""
+
+      return sPath
+
+# eof class CPathNormalizer(object):
+
+# --------------------------------------------------------------------------------------------------------------
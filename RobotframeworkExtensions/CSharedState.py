@@ -0,0 +1,218 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CSharedState.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+
+"""
+The module ``CSharedState`` contains the state shared by the ``Collection`` libraries of several processes (e.g. the
+processes of a parallel execution with pabot): an SQLite database.
+"""
+
+import os, time, sqlite3
+from array import array
+from contextlib import contextmanager
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# tables of the database
+#
+listTables = ["CREATE TABLE IF NOT EXISTS path_cache (key TEXT PRIMARY KEY, env_values TEXT, normalized_path TEXT, last_use INTEGER)",
+              "CREATE TABLE IF NOT EXISTS keyword_timing (run TEXT, process TEXT, keyword TEXT, calls INTEGER, total INTEGER, minimum INTEGER, "
+              "maximum INTEGER, bytes INTEGER, histogram BLOB, PRIMARY KEY (run, process, keyword))"]
+
+# number of test executions (runs) whose keyword timing is kept in the database
+KEYWORD_TIMING_RUNS = 10
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CSharedState(object):
+   """
+The class ``CSharedState`` stores the state shared by several processes in an SQLite database (``sDatabaseFile``):
+
+* cached normalized paths (``normalize_path``): every process starts with the paths normalized by the processes before,
+* keyword timing (``bTiming``): the results of all processes of one test execution (``sRun``) are combined within one report;
+  the results of other test executions (e.g. earlier ones using the same database) are not part of this report.
+
+The database is read once at the start (bulk load) and written once at the end of the process (one transaction; listener API
+version 3: ``close``) - and not with every keyword call. Concurrent accesses of several processes are serialized by SQLite
+(write-ahead log; waiting up to ``fTimeout`` seconds for a lock).
+   """
+
+   ROBOT_LISTENER_API_VERSION = 3
+
+   def __init__(self, sDatabaseFile=None, sRun=None, fTimeout=60.0):
+      self.sDatabaseFile     = sDatabaseFile
+      self.fTimeout          = fTimeout
+      self.sProcess          = f"{os.getpid()}@{time.time()}" # identifies the results of this process
+      self.sRun              = self.sProcess if sRun is None else sRun # identifies the test execution this process belongs to
+      self.oConnection       = None
+      self.listCloseHandlers = [] # functions writing the data of this process (called by 'close')
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _GetConnection(self):
+      """
+Returns the connection to the database (opened with the first access; the tables are created, if not existing).
+      """
+      if self.oConnection is None:
+         os.makedirs(os.path.dirname(os.path.abspath(self.sDatabaseFile)), exist_ok=True)
+         self.oConnection = sqlite3.connect(self.sDatabaseFile, timeout=self.fTimeout, isolation_level=None) # transactions: see '_Transaction'
+         self.oConnection.execute("PRAGMA journal_mode=WAL")
+         self.oConnection.execute("PRAGMA synchronous=NORMAL")
+         for sTable in listTables:
+            self.oConnection.execute(sTable)
+      return self.oConnection
+
+   @contextmanager
+   def _Transaction(self):
+      """
+Context of one write transaction: the database is locked for the other processes until the end of the context.
+      """
+      oConnection = self._GetConnection()
+      oConnection.execute("BEGIN IMMEDIATE")
+      try:
+         yield oConnection
+         oConnection.execute("COMMIT")
+      except Exception:
+         oConnection.execute("ROLLBACK")
+         raise
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def LoadPathCache(self, nLimit=1000):
+      """
+Returns the ``nLimit`` most recently used entries of the path cache as dictionary: key -> (values of the environment variables,
+normalized path). Keys and values of the environment variables are strings (``repr`` of the tuples used by ``CPathCache``);
+they are not decoded (bulk load with one query).
+      """
+      oCursor = self._GetConnection().execute("SELECT key, env_values, normalized_path FROM path_cache ORDER BY last_use DESC, rowid DESC LIMIT ?", (nLimit,))
+      return {sKey : (sEnvValues, sNormalizedPath) for sKey, sEnvValues, sNormalizedPath in oCursor.fetchall()}
+
+   def StorePathCache(self, listEntries=None, nLimit=1000):
+      """
+Stores the entries of the path cache used by this process ``listEntries`` (list of key, values of the environment variables,
+normalized path; all strings): new entries are added, entries already stored (e.g. by another process) are marked as used
+(the values are not changed). Only the ``nLimit`` most recently used entries are kept (LRU).
+      """
+      if len(listEntries) == 0:
+         return
+      with self._Transaction() as oConnection:
+         nLastUse = oConnection.execute("SELECT IFNULL(MAX(last_use), 0) + 1 FROM path_cache").fetchone()[0]
+         oConnection.executemany("INSERT INTO path_cache (key, env_values, normalized_path, last_use) VALUES (?, ?, ?, ?) "
+                                 "ON CONFLICT (key) DO UPDATE SET last_use = excluded.last_use",
+                                 [(sKey, sEnvValues, sNormalizedPath, nLastUse) for sKey, sEnvValues, sNormalizedPath in listEntries])
+         oConnection.execute("DELETE FROM path_cache WHERE key NOT IN (SELECT key FROM path_cache ORDER BY last_use DESC, rowid DESC LIMIT ?)", (nLimit,))
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def StoreKeywordTiming(self, dictKeywords=None, oCombinedFunction=None):
+      """
+Stores the keyword timing of this process (``dictKeywords``: see ``CKeywordTimer``) and calls ``oCombinedFunction`` with the
+combined keyword timing of all processes of this test execution stored so far (see ``LoadKeywordTiming``) - within the same
+transaction: processes finishing at the same time are serialized, the last one gets the keyword timing of all processes.
+The keyword timing of the ``KEYWORD_TIMING_RUNS`` most recent test executions is kept.
+      """
+      listRows = [(self.sRun, self.sProcess, sKeyword, nCalls, nTotal, nMin, nMax, nBytes,
+                   array("q", [nValue for tupleItem in dictHistogram.items() for nValue in tupleItem]).tobytes()) # bucket, number, ...
+                  for sKeyword, (nCalls, nTotal, nMin, nMax, nBytes, dictHistogram) in dictKeywords.items()]
+      with self._Transaction() as oConnection:
+         oConnection.executemany("INSERT OR REPLACE INTO keyword_timing VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", listRows)
+         oConnection.execute("DELETE FROM keyword_timing WHERE run NOT IN "
+                             "(SELECT run FROM keyword_timing GROUP BY run ORDER BY MAX(rowid) DESC LIMIT ?)", (KEYWORD_TIMING_RUNS,))
+         if oCombinedFunction is not None:
+            oCombinedFunction(*self._LoadKeywordTiming(oConnection))
+
+   def _LoadKeywordTiming(self, oConnection=None):
+      """
+Returns the combined keyword timing of all processes of this test execution read with ``oConnection``.
+      """
+      dictKeywords = {}
+      setProcesses = set()
+      for sProcess, sKeyword, nCalls, nTotal, nMin, nMax, nBytes, bHistogram in oConnection.execute(
+             "SELECT process, keyword, calls, total, minimum, maximum, bytes, histogram FROM keyword_timing WHERE run = ?", (self.sRun,)):
+         setProcesses.add(sProcess)
+         listHistogram = array("q")
+         listHistogram.frombytes(bHistogram)
+         listEntry = dictKeywords.get(sKeyword)
+         if listEntry is None:
+            listEntry = dictKeywords[sKeyword] = [0, 0, nMin, nMax, 0, {}]
+         listEntry[0] = listEntry[0] + nCalls
+         listEntry[1] = listEntry[1] + nTotal
+         listEntry[2] = min(listEntry[2], nMin)
+         listEntry[3] = max(listEntry[3], nMax)
+         listEntry[4] = listEntry[4] + nBytes
+         dictHistogram = listEntry[5]
+         for nBucket, nNumber in zip(listHistogram[0::2], listHistogram[1::2]):
+            dictHistogram[nBucket] = dictHistogram.get(nBucket, 0) + nNumber
+      return dictKeywords, len(setProcesses)
+
+   def LoadKeywordTiming(self):
+      """
+Returns the combined keyword timing of all processes of this test execution (same format as ``dictKeywords`` of ``CKeywordTimer``)
+and the number of processes.
+      """
+      return self._LoadKeywordTiming(self._GetConnection())
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def AddCloseHandler(self, oFunction=None):
+      """
+Registers a function (without arguments) writing data of this process to the database at the end of the process.
+      """
+      self.listCloseHandlers.append(oFunction)
+
+   # --------------------------------------------------------------------------------------------------------------
+   # listener interface
+
+   def close(self):
+      # all close handlers are called and the connection is closed, also in case of a close handler fails (the first error is raised)
+      oError = None
+      try:
+         for oFunction in self.listCloseHandlers:
+            try:
+               oFunction()
+            except Exception as ex:
+               if oError is None:
+                  oError = ex
+      finally:
+         if self.oConnection is not None:
+            self.oConnection.close()
+            self.oConnection = None
+      if oError is not None:
+         raise oError
+
+# eof class CSharedState(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,232 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CTreeIndex.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CTreeIndex`` contains the directory tree index behind the keywords ``index_tree``, ``query_tree_index``
+and ``diff_tree_index``.
+"""
+
+import os, re, fnmatch, posixpath
+from bisect import bisect_left
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def NormalizeRelativePath(sPath=None):
+   """
+Returns the normalized version of the relative path ``sPath``: slashes as separators, without redundant separators,
+without ``.`` and without resolvable up-level references (e.g. ``./sub\\\\dir/../file.txt`` -> ``sub/file.txt``).
+   """
+   sPath = posixpath.normpath(sPath.strip().replace("\\", "/"))
+   return sPath.lstrip("/")
+
+def CompilePatterns(oPatterns=None):
+   """
+Returns one regular expression matching all glob patterns ``oPatterns`` (string or list of strings) - or ``None``
+in case of no patterns are given.
+   """
+   if oPatterns is None:
+      return None
+   if isinstance(oPatterns, str):
+      oPatterns = [oPatterns]
+   listPatterns = [fnmatch.translate(NormalizeRelativePath(sPattern)) for sPattern in oPatterns]
+   if len(listPatterns) == 0:
+      return None
+   return re.compile("|".join(f"(?:{sPattern})" for sPattern in listPatterns))
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CTreeIndex(object):
+   """
+The class ``CTreeIndex`` contains the sorted, normalized and deduplicated relative paths of all files (and optionally
+directories) below a root folder.
+
+The tree is walked iteratively by ``os.scandir`` (generator ``Walk``); only the paths themselves are kept in memory
+(one sorted list of strings). Directories matching an exclude pattern are not walked at all.
+   """
+
+   def __init__(self, sRootPath=None, oIncludes=None, oExcludes=None, bFiles=True, bDirectories=False, bFollowLinks=False):
+      """
+**Arguments:**
+
+* ``sRootPath``
+
+  / *Condition*: required / *Type*: str /
+
+  Normalized path of the root folder
+
+* ``oIncludes``, ``oExcludes``
+
+  / *Condition*: optional / *Type*: str, list / *Default*: None /
+
+  Glob patterns (relative to the root folder, slashes as separators; ``*`` also matches separators). Only entries matching
+  at least one include pattern and no exclude pattern are part of the index. ``None``: all entries are included,
+  no entry is excluded.
+
+* ``bFiles``, ``bDirectories``
+
+  / *Condition*: optional / *Type*: bool / *Default*: True, False /
+
+  Types of entries that are part of the index
+
+* ``bFollowLinks``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, symbolic links to directories are walked. Every directory is walked only once (symbolic link cycles
+  and several links to the same directory).
+      """
+      self.sRootPath    = sRootPath
+      self.regexInclude = CompilePatterns(oIncludes)
+      self.regexExclude = CompilePatterns(oExcludes)
+      self.bFiles       = bFiles
+      self.bDirectories = bDirectories
+      self.bFollowLinks = bFollowLinks
+      self.listPaths    = list(self.Walk())
+      self.listPaths.sort()
+      nCount = 0 # remove duplicates in place (e.g. 'a\\b' and 'a/b' have the same normalized path)
+      for sPath in self.listPaths:
+         if (nCount == 0) or (sPath != self.listPaths[nCount - 1]):
+            self.listPaths[nCount] = sPath
+            nCount = nCount + 1
+      del self.listPaths[nCount:]
+
+   def __del__(self):
+      pass
+
+   def __len__(self):
+      return len(self.listPaths)
+
+   def __repr__(self):
+      return f"<CTreeIndex of '{self.sRootPath}': {len(self.listPaths)} entries>"
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Walk(self):
+      """
+Generator providing the normalized relative paths of all entries below the root folder, that pass the filters.
+      """
+      listFolders = [(self.sRootPath, "")] # folders still to be walked: (path, relative path)
+      setVisited = None # (device, inode) of all walked folders; only required if symbolic links are followed
+      if self.bFollowLinks is True:
+         setVisited = set()
+         try:
+            oStat = os.stat(self.sRootPath)
+            setVisited.add((oStat.st_dev, oStat.st_ino))
+         except OSError:
+            pass
+      while len(listFolders) > 0:
+         sFolder, sRelFolder = listFolders.pop()
+         try:
+            oEntries = os.scandir(sFolder)
+         except OSError:
+            continue # e.g. no access rights
+         with oEntries:
+            for oEntry in oEntries:
+               sRelPath = sRelFolder + oEntry.name.replace("\\", "/")
+               if (self.regexExclude is not None) and (self.regexExclude.match(sRelPath) is not None):
+                  continue
+               try:
+                  bDirectory = oEntry.is_dir(follow_symlinks=self.bFollowLinks)
+               except OSError:
+                  bDirectory = False
+               if bDirectory is True:
+                  if setVisited is None:
+                     listFolders.append((oEntry.path, sRelPath + "/"))
+                  else:
+                     try:
+                        oStat = oEntry.stat()
+                        if oStat.st_ino == 0:
+                           oStat = os.stat(oEntry.path) # Windows: 'DirEntry.stat' does not provide device and inode
+                        tupleKey = (oStat.st_dev, oStat.st_ino)
+                     except OSError:
+                        tupleKey = None
+                     if (tupleKey is not None) and (tupleKey not in setVisited):
+                        setVisited.add(tupleKey)
+                        listFolders.append((oEntry.path, sRelPath + "/"))
+                  if self.bDirectories is False:
+                     continue
+               elif self.bFiles is False:
+                  continue
+               if (self.regexInclude is None) or (self.regexInclude.match(sRelPath) is not None):
+                  yield sRelPath
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Query(self, sPattern="*"):
+      """
+Returns the sorted list of all relative paths matching the glob pattern ``sPattern``. Patterns without wildcards are
+looked up directly (binary search).
+      """
+      sPattern = NormalizeRelativePath(sPattern)
+      if re.search(r"[*?\[]", sPattern) is None:
+         nIndex = bisect_left(self.listPaths, sPattern)
+         if (nIndex < len(self.listPaths)) and (self.listPaths[nIndex] == sPattern):
+            return [sPattern]
+         return []
+      regexPattern = CompilePatterns(sPattern)
+      return [sPath for sPath in self.listPaths if regexPattern.match(sPath) is not None]
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Diff(self, oExpected=None):
+      """
+Compares the index with ``oExpected`` (another ``CTreeIndex`` or a list of relative paths, e.g. a manifest) and returns
+the tuple ``(listMissing, listUnexpected)``: expected paths that are not part of the index, and paths of the index that are
+not expected. Both lists are sorted; the comparison is a merge of two sorted lists.
+      """
+      if isinstance(oExpected, CTreeIndex):
+         listExpected = oExpected.listPaths
+      else:
+         listExpected = sorted(set(NormalizeRelativePath(sPath) for sPath in oExpected))
+      listMissing    = []
+      listUnexpected = []
+      nIndex1 = 0
+      nIndex2 = 0
+      listPaths = self.listPaths
+      while (nIndex1 < len(listPaths)) and (nIndex2 < len(listExpected)):
+         if listPaths[nIndex1] == listExpected[nIndex2]:
+            nIndex1 = nIndex1 + 1
+            nIndex2 = nIndex2 + 1
+         elif listPaths[nIndex1] < listExpected[nIndex2]:
+            listUnexpected.append(listPaths[nIndex1])
+            nIndex1 = nIndex1 + 1
+         else:
+            listMissing.append(listExpected[nIndex2])
+            nIndex2 = nIndex2 + 1
+      listUnexpected.extend(listPaths[nIndex1:])
+      listMissing.extend(listExpected[nIndex2:])
+      return listMissing, listUnexpected
+
+# eof class CTreeIndex(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CTypeDiff.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CTypeDiff`` contains the comparison engine behind the ``pretty_diff`` keyword.
+"""
+
+from RobotframeworkExtensions.CTypeRenderer import CTypeRenderer, GetTypeTag, setSequenceTags, setMappingTags
+from RobotframeworkExtensions.CTypeHash import CTypeHash
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CTypeDiff(object):
+   """
+The class ``CTypeDiff`` compares two data structures and computes the pretty print lines of the differences only.
+
+At first the structural hashes of all containers of both data structures are computed (bottom-up, see ``CTypeHash``).
+Afterwards both data structures are compared top-down; containers with equal hashes are skipped without any further
+comparison and without any rendering. Only the paths to the differing elements are resolved.
+
+Lines of the first data structure start with ``-``, lines of the second data structure start with ``+``.
+Elements of dictionaries are compared by their keys, elements of lists and tuples by their position, elements of sets
+by their content.
+   """
+
+   def __init__(self):
+      self.oTypeHash = CTypeHash()
+      self.oTypeRenderer = CTypeRenderer()
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _RenderSide(self, sSign, oData, sPrefix):
+      """
+Generator providing the lines of a complete (sub-)structure that is part of one side of the comparison only.
+      """
+      for sLine in self.oTypeRenderer.Render(oData, sPrefix):
+         yield f"{sSign} {sLine}"
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _Compare(self, oData1, oData2, sPrefix1, sPrefix2):
+      """
+Generator comparing ``oData1`` and ``oData2``. Provides either lines (``str``) or further comparisons to be done
+(``tuple``: ``oData1, oData2, sPrefix1, sPrefix2``).
+      """
+      if oData1 is oData2:
+         return
+      sTypeTag1 = GetTypeTag(oData1)
+      sTypeTag2 = GetTypeTag(oData2)
+      if self.oTypeHash.GetToken(oData1) == self.oTypeHash.GetToken(oData2):
+         return
+
+      bContainer = (sTypeTag1 == sTypeTag2) and ( (sTypeTag1 in setSequenceTags) or (sTypeTag1 in setMappingTags) )
+      if (bContainer is False) or (len(oData1) == 0) or (len(oData2) == 0):
+         # different simple values, different types or empty containers: both sides are printed completely
+         yield from self._RenderSide("-", oData1, sPrefix1)
+         yield from self._RenderSide("+", oData2, sPrefix2)
+         return
+
+      nNrOfElements1    = len(oData1)
+      nNrOfElements2    = len(oData2)
+      sContainerPrefix1 = sTypeTag1 if sPrefix1 == "" else f"{sPrefix1} {sTypeTag1}"
+      sContainerPrefix2 = sTypeTag2 if sPrefix2 == "" else f"{sPrefix2} {sTypeTag2}"
+
+      if sTypeTag1 in setMappingTags:
+         dictPositions2 = {oKey : nIndex for nIndex, oKey in enumerate(oData2)}
+         for nIndex1, (oKey, oValue1) in enumerate(oData1.items()):
+            sElementPrefix1 = f"{sContainerPrefix1} ({nNrOfElements1}/{nIndex1 + 1}) > {{{oKey}}}"
+            if oKey in dictPositions2:
+               sElementPrefix2 = f"{sContainerPrefix2} ({nNrOfElements2}/{dictPositions2[oKey] + 1}) > {{{oKey}}}"
+               yield (oValue1, oData2[oKey], sElementPrefix1, sElementPrefix2)
+            else:
+               yield from self._RenderSide("-", oValue1, sElementPrefix1)
+         for oKey, nIndex2 in dictPositions2.items():
+            if oKey not in oData1:
+               yield from self._RenderSide("+", oData2[oKey], f"{sContainerPrefix2} ({nNrOfElements2}/{nIndex2 + 1}) > {{{oKey}}}")
+
+      elif sTypeTag1 == "[SET]":
+         listTokens1 = [self.oTypeHash.GetToken(oElement) for oElement in oData1]
+         listTokens2 = [self.oTypeHash.GetToken(oElement) for oElement in oData2]
+         setTokens1  = set(listTokens1)
+         setTokens2  = set(listTokens2)
+         for nIndex1, oElement in enumerate(oData1):
+            if listTokens1[nIndex1] not in setTokens2:
+               yield from self._RenderSide("-", oElement, f"{sContainerPrefix1} ({nNrOfElements1}/{nIndex1 + 1}) >")
+         for nIndex2, oElement in enumerate(oData2):
+            if listTokens2[nIndex2] not in setTokens1:
+               yield from self._RenderSide("+", oElement, f"{sContainerPrefix2} ({nNrOfElements2}/{nIndex2 + 1}) >")
+
+      else:
+         for nIndex, (oElement1, oElement2) in enumerate(zip(oData1, oData2)):
+            yield (oElement1, oElement2,
+                   f"{sContainerPrefix1} ({nNrOfElements1}/{nIndex + 1}) >",
+                   f"{sContainerPrefix2} ({nNrOfElements2}/{nIndex + 1}) >")
+         for nIndex in range(nNrOfElements2, nNrOfElements1):
+            yield from self._RenderSide("-", oData1[nIndex], f"{sContainerPrefix1} ({nNrOfElements1}/{nIndex + 1}) >")
+         for nIndex in range(nNrOfElements1, nNrOfElements2):
+            yield from self._RenderSide("+", oData2[nIndex], f"{sContainerPrefix2} ({nNrOfElements2}/{nIndex + 1}) >")
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Diff(self, oData1=None, oData2=None):
+      """
+Generator providing the pretty print lines of the differences between ``oData1`` and ``oData2``.
+
+**Arguments:**
+
+* ``oData1``, ``oData2``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  Data to be compared
+
+**Returns:**
+
+* ``sLine``
+
+  / *Type*: str /
+
+  The next line of output (generator); no lines in case of both data structures are equal.
+      """
+      # -- bottom-up: structural hashes of all containers
+      self.oTypeHash.Hash(oData1)
+      self.oTypeHash.Hash(oData2)
+
+      # -- top-down: comparison (iteratively; every comparison is a generator on the stack)
+      listComparisons = [self._Compare(oData1, oData2, "", "")]
+      setActive       = set() # pairs of containers currently under comparison (cycle detection)
+      listPairs       = [None]
+      while len(listComparisons) > 0:
+         oNext = next(listComparisons[-1], None)
+         if oNext is None:
+            del listComparisons[-1]
+            tuplePair = listPairs.pop()
+            setActive.discard(tuplePair)
+         elif type(oNext) is str:
+            yield oNext
+         else:
+            tuplePair = (id(oNext[0]), id(oNext[1]))
+            if tuplePair in setActive:
+               continue # both sides contain the same cycle; the differences are already under computation
+            setActive.add(tuplePair)
+            listPairs.append(tuplePair)
+            listComparisons.append(self._Compare(*oNext))
+
+   # eof def Diff(self, oData1=None, oData2=None):
+
+# eof class CTypeDiff(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,274 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CTypeHash.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CTypeHash`` computes structural hashes of Python data - based on the same type resolution as the
+``pretty_print`` keyword: two data structures have the same hash, if their pretty print output is the same.
+"""
+
+from hashlib import blake2b
+from collections import OrderedDict
+
+from RobotframeworkExtensions.CTypeRenderer import GetTypeTag, dictTypeTags, setSequenceTags, setMappingTags
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# values longer than this are represented by their own hash within the leaf token (instead of by the value itself)
+#
+LONG_VALUE_LENGTH = 1024
+
+# types of simple data, that cannot be changed (the hashes of tuples consisting of such data only can be cached)
+setImmutableTypes = {type(None), int, float, bool, str}
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetLeafToken(oData=None, sTypeTag=None):
+   """
+Returns the byte string representing a simple data type (or an empty container) within the structural hash.
+   """
+   if sTypeTag is None:
+      sTypeTag = GetTypeTag(oData)
+   sValue = oData if type(oData) is str else str(oData)
+   if len(sValue) > LONG_VALUE_LENGTH:
+      sValue = "#" + blake2b(sValue.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+   return f"{sTypeTag}\x1f{len(sValue)}\x1f{sValue}".encode("utf-8", "surrogatepass")
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CTypeHash(object):
+   """
+The class ``CTypeHash`` computes structural hashes of Python data bottom-up.
+
+The hash of a container is computed out of its type, its number of elements and the hashes of its elements
+(the keys included). The order of the elements is considered - except for sets. The data structure is streamed
+into the hash; a textual rendering is not computed.
+
+The hashes of all containers are kept (``dictDigests``: identity of the container -> hash) and can be used to compare
+substructures - until ``Clear`` is called. Additionally the hashes of immutable objects (long strings and tuples
+consisting of immutable objects only) are kept in a cache (LRU, ``nCacheSize`` entries) that survives ``Clear``.
+Therefore unchanged immutable parts of a data structure are not traversed again by following computations.
+   """
+
+   def __init__(self, nCacheSize=0):
+      self.dictDigests   = {} # identity -> digest of all containers hashed since the last 'Clear'
+      self.setImmutable  = set() # identities of these containers, that are immutable (tuples consisting of immutable objects only)
+      self.listKeepAlive = [] # references to these containers (keep the identities valid)
+      self.nCacheSize    = nCacheSize
+      self.dictCache     = OrderedDict() # identity -> (immutable object, token); the reference keeps the identity valid
+      self.nCacheHits    = 0
+      self.nCacheMisses  = 0
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Clear(self):
+      """
+Forgets the hashes of all containers hashed before (required in case of the content of these containers may have changed).
+The cache of the hashes of immutable objects is kept.
+      """
+      self.dictDigests   = {}
+      self.setImmutable  = set()
+      self.listKeepAlive = []
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _GetCached(self, oData):
+      """
+Returns the cached token of the immutable object ``oData`` - or ``None``.
+      """
+      tupleEntry = self.dictCache.get(id(oData))
+      if (tupleEntry is not None) and (tupleEntry[0] is oData):
+         self.dictCache.move_to_end(id(oData))
+         self.nCacheHits = self.nCacheHits + 1
+         return tupleEntry[1]
+      self.nCacheMisses = self.nCacheMisses + 1
+      return None
+
+   def _SetCached(self, oData, bToken):
+      """
+Adds the token of the immutable object ``oData`` to the cache.
+      """
+      self.dictCache[id(oData)] = (oData, bToken)
+      if len(self.dictCache) > self.nCacheSize:
+         self.dictCache.popitem(last=False)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _GetLeafToken(self, oData, sTypeTag):
+      """
+Returns the leaf token of ``oData`` (see ``GetLeafToken``); the tokens of long strings are cached.
+      """
+      if (self.nCacheSize > 0) and (type(oData) is str) and (len(oData) > LONG_VALUE_LENGTH):
+         bToken = self._GetCached(oData)
+         if bToken is None:
+            bToken = GetLeafToken(oData, sTypeTag)
+            self._SetCached(oData, bToken)
+         return bToken
+      return GetLeafToken(oData, sTypeTag)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def GetToken(self, oData=None):
+      """
+Returns the token of ``oData`` within the hash of the surrounding container: the leaf token of simple data types
+and empty containers, the structural hash (digest) of all other containers.
+      """
+      sTypeTag = GetTypeTag(oData)
+      if ( (sTypeTag in setSequenceTags) or (sTypeTag in setMappingTags) ) and (len(oData) > 0):
+         return b"C" + self.Hash(oData)
+      return b"L" + self._GetLeafToken(oData, sTypeTag)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Hash(self, oData=None):
+      """
+Computes the structural hash of ``oData``.
+
+The data structure is traversed iteratively (no recursion). A container that contains itself is hashed as
+back-reference. Containers already hashed by this instance are not traversed again.
+
+**Arguments:**
+
+* ``oData``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  Data to be hashed
+
+**Returns:**
+
+* ``bDigest``
+
+  / *Type*: bytes /
+
+  The structural hash (16 bytes)
+      """
+      sTypeTag = GetTypeTag(oData)
+      if not ( ( (sTypeTag in setSequenceTags) or (sTypeTag in setMappingTags) ) and (len(oData) > 0) ):
+         return blake2b(self._GetLeafToken(oData, sTypeTag), digest_size=16).digest()
+      if id(oData) in self.dictDigests:
+         return self.dictDigests[id(oData)]
+      bCache = self.nCacheSize > 0
+      if (bCache is True) and (type(oData) is tuple):
+         bToken = self._GetCached(oData)
+         if bToken is not None:
+            return bToken[1:]
+
+      def NewFrame(oContainer, sContainerTypeTag, bKeyToken):
+         # frame: container, element iterator, hash object, tokens of elements not yet hashed, flags, key token within the surrounding container,
+         #        immutable flag (tuple consisting of immutable objects only)
+         bMapping = sContainerTypeTag in setMappingTags
+         oIterator = iter(oContainer.items()) if bMapping is True else iter(oContainer)
+         oHash = blake2b(f"{sContainerTypeTag}\x1f{len(oContainer)}".encode("utf-8"), digest_size=16)
+         return [oContainer, oIterator, oHash, [], sContainerTypeTag == "[SET]", bMapping, bKeyToken, type(oContainer) is tuple]
+
+      listFrames = [NewFrame(oData, sTypeTag, b"")]
+      dictActive = {id(oData) : 0} # identity -> depth of all containers currently under computation
+
+      while True:
+         listFrame = listFrames[-1]
+         oIterator, oHash, listTokens, bSet, bMapping = listFrame[1:6]
+         bNewFrame = False
+         for oNext in oIterator:
+            if bMapping is True:
+               oKey, oElement = oNext
+               bKeyToken = self._GetLeafToken(oKey, GetTypeTag(oKey)) + b"\x1e"
+            else:
+               oElement  = oNext
+               bKeyToken = b""
+            sElementTypeTag = dictTypeTags.get(type(oElement)) or GetTypeTag(oElement)
+            if ( (sElementTypeTag in setSequenceTags) or (sElementTypeTag in setMappingTags) ) and (len(oElement) > 0):
+               bToken = None
+               if type(oElement) is not tuple:
+                  listFrame[7] = False
+               elif bCache is True:
+                  bToken = self._GetCached(oElement)
+               if bToken is not None:
+                  pass
+               elif id(oElement) in self.dictDigests:
+                  bToken = b"C" + self.dictDigests[id(oElement)]
+                  if id(oElement) not in self.setImmutable:
+                     listFrame[7] = False # a tuple containing mutable objects (hashed before) is not immutable
+               elif id(oElement) in dictActive:
+                  bToken = f"R{len(listFrames) - dictActive[id(oElement)]}".encode("utf-8") # back-reference (cycle)
+                  listFrame[7] = False
+               else:
+                  dictActive[id(oElement)] = len(listFrames)
+                  listFrames.append(NewFrame(oElement, sElementTypeTag, bKeyToken))
+                  bNewFrame = True
+                  break
+            else:
+               if type(oElement) not in setImmutableTypes:
+                  listFrame[7] = False
+               bToken = b"L" + self._GetLeafToken(oElement, sElementTypeTag)
+            bToken = bKeyToken + bToken
+            listTokens.append(len(bToken).to_bytes(4, "little") + bToken)
+            if (bSet is False) and (len(listTokens) >= 4096):
+               oHash.update(b"".join(listTokens)) # keeps the memory bounded in case of large containers
+               listTokens.clear()
+         if bNewFrame is True:
+            continue
+
+         # -- all elements of this container are hashed
+         if bSet is True:
+            listTokens.sort() # the order of the elements of a set is not relevant
+         oHash.update(b"".join(listTokens))
+         bDigest = oHash.digest()
+         oContainer = listFrame[0]
+         self.dictDigests[id(oContainer)] = bDigest
+         self.listKeepAlive.append(oContainer)
+         if listFrame[7] is True:
+            self.setImmutable.add(id(oContainer))
+            if bCache is True:
+               self._SetCached(oContainer, b"C" + bDigest)
+         del dictActive[id(oContainer)]
+         del listFrames[-1]
+         if len(listFrames) == 0:
+            return bDigest
+
+         # -- add the hash of this container to the tokens of the surrounding container
+         listParentFrame = listFrames[-1]
+         if listFrame[7] is False:
+            listParentFrame[7] = False
+         bToken = listFrame[6] + b"C" + bDigest
+         listParentFrame[3].append(len(bToken).to_bytes(4, "little") + bToken)
+
+   # eof def Hash(self, oData=None):
+
+# eof class CTypeHash(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,656 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CTypeRenderer.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+"""
+The module ``CTypeRenderer`` contains the rendering engine behind the ``pretty_print`` keyword.
+
+The output format is the same as the one of ``CTypePrint`` (PythonExtensionsCollection), but the lines are computed
+lazily (generator) and the traversal of the data structure can be limited (depth, elements per container, lines)
+or reduced to samples of the elements of every container (head, tail, random sample).
+
+Large binary data (``bytes``, ``bytearray``, ``memoryview``) and large NumPy arrays are not rendered element by element,
+but summarized within one single line (see ``GetSummary``).
+"""
+
+import sys, time, random, signal
+from itertools import islice
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# type tags of the data types known by the renderer (all other types are printed with their full type name)
+#
+dictTypeTags = {type(None) : "[NONE]",
+                int        : "[INT]",
+                float      : "[FLOAT]",
+                bool       : "[BOOL]",
+                str        : "[STR]",
+                list       : "[LIST]",
+                tuple      : "[TUPLE]",
+                set        : "[SET]",
+                dict       : "[DICT]"}
+
+# -- output of empty containers
+dictEmptyValues = {"[LIST]"    : "[]",
+                   "[TUPLE]"   : "()",
+                   "[SET]"     : "()",
+                   "[DICT]"    : "{}",
+                   "[DOTDICT]" : "{}"}
+
+setSequenceTags = {"[LIST]", "[TUPLE]", "[SET]"}
+setMappingTags  = {"[DICT]", "[DOTDICT]"}
+
+# -- binary data and arrays with more bytes/elements than this are summarized (smaller ones are printed completely)
+SUMMARY_THRESHOLD = 64
+
+# -- number of bytes shown at the beginning and at the end of the summary of binary data
+PREVIEW_LENGTH = 16
+
+# -- parallel rendering: number of chunks per process (smaller chunks balance the load of the processes)
+CHUNKS_PER_PROCESS = 4
+
+# -- parallel rendering: data and renderer of the parent process (inherited by the forked processes)
+_tupleParallelJob = None
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def GetTypeTag(oData=None):
+   """
+Returns the type tag of ``oData`` (e.g. ``[LIST]``), resolved in the same way like ``CTypePrint`` is doing.
+
+Dot dictionaries (e.g. the ``DotDict`` of the Robot Framework) are identified by their type name.
+   """
+   oType = type(oData)
+   sTypeTag = dictTypeTags.get(oType)
+   if sTypeTag is None:
+      sType = str(oType)
+      if sType.upper().find("DOTDICT") != -1:
+         sTypeTag = "[DOTDICT]"
+      else:
+         sTypeTag = "[" + sType + "]"
+      dictTypeTags[oType] = sTypeTag # the type tag of a type does not change; therefore it is computed only once
+   return sTypeTag
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+def _SummarizeBuffer(oData):
+   """
+Returns the summary of binary data: length and hex preview of the beginning and of the end.
+The data is accessed by a ``memoryview`` (no copy of the data).
+   """
+   oView = memoryview(oData)
+   if (oView.ndim != 1) or (oView.itemsize != 1):
+      if oView.c_contiguous is False:
+         return f"<{oView.nbytes:,} bytes, format '{oView.format}', shape {oView.shape}>"
+      oView = oView.cast("B")
+   nLength = oView.nbytes
+   if nLength <= SUMMARY_THRESHOLD:
+      return None
+   return f"<{nLength:,} bytes: {oView[:PREVIEW_LENGTH].hex(' ')} ... {oView[-PREVIEW_LENGTH:].hex(' ')}>"
+
+def _SummarizeArray(oData):
+   """
+Returns the summary of a NumPy array: shape, data type and (numerical data types only) minimum, maximum, mean value
+and number of NaN values - computed vectorized by NumPy.
+   """
+   if oData.size <= SUMMARY_THRESHOLD:
+      return None
+   import numpy # already loaded (otherwise no NumPy array could exist)
+   sSummary = f"<ndarray shape={oData.shape} dtype={oData.dtype}"
+   if numpy.issubdtype(oData.dtype, numpy.floating):
+      nNaN = int(numpy.count_nonzero(numpy.isnan(oData)))
+      if nNaN < oData.size:
+         sSummary = f"{sSummary} min={numpy.nanmin(oData)} max={numpy.nanmax(oData)} mean={numpy.nanmean(oData)}"
+      sSummary = f"{sSummary} nan={nNaN:,}"
+   elif numpy.issubdtype(oData.dtype, numpy.integer) or numpy.issubdtype(oData.dtype, numpy.bool_):
+      sSummary = f"{sSummary} min={oData.min()} max={oData.max()} mean={oData.mean()}"
+   return sSummary + ">"
+
+# -- summary functions per type
+dictSummaries = {bytes      : _SummarizeBuffer,
+                 bytearray  : _SummarizeBuffer,
+                 memoryview : _SummarizeBuffer}
+
+def GetSummary(oData=None):
+   """
+Returns the one line summary of large binary data and large NumPy arrays - or ``None`` in case of ``oData`` has to be
+printed completely.
+
+NumPy is not imported by this module. NumPy arrays are identified by the type only; in case of NumPy is not loaded
+by the caller, no NumPy array can exist.
+   """
+   oType = type(oData)
+   oSummary = dictSummaries.get(oType)
+   if oSummary is None:
+      if ("numpy" not in sys.modules) or (oType is not sys.modules["numpy"].ndarray):
+         return None
+      oSummary = dictSummaries[oType] = _SummarizeArray
+   return oSummary(oData)
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+# -- conversion of values into record values per type (data types supported by JSON are taken over unchanged)
+dictRecordValues = {type(None) : None,
+                    int        : None,
+                    float      : None,
+                    bool       : None,
+                    str        : None,
+                    list       : list,
+                    tuple      : list,
+                    set        : list,
+                    dict       : dict}
+
+def GetRecordValue(oData=None, sTypeTag=None):
+   """
+Returns the value of a simple data type (or of an empty container) within a record (see ``CTypeRenderer.RenderRecords``):
+the value itself in case of JSON supports the data type, an empty list or dictionary in case of empty containers, and the
+printed value (as string) in case of all other data types.
+   """
+   oType = type(oData)
+   if oType in dictRecordValues:
+      oConvert = dictRecordValues[oType]
+      return oData if oConvert is None else oConvert()
+   if sTypeTag == "[DOTDICT]":
+      return {}
+   sValue = GetSummary(oData)
+   if sValue is None:
+      sValue = str(oData)
+   return sValue
+
+def GetNestedDict(listRecords=None):
+   """
+Returns the nested dictionary built out of the records provided by ``CTypeRenderer.RenderRecords``: every container is
+a dictionary with the keys (dictionaries) or indices (all other containers) of its elements as keys; simple data types
+are the record values. Records without value (``note``) are not considered. In case of the top level data is not
+a container, the record value of this data is returned.
+   """
+   dictNested = {}
+   for dictRecord in listRecords:
+      if "value" not in dictRecord:
+         continue
+      listPath = dictRecord["path"]
+      if len(listPath) == 0:
+         return dictRecord["value"]
+      dictParent = dictNested
+      for oStep in listPath[:-1]:
+         dictParent = dictParent.setdefault(oStep, {})
+      dictParent[listPath[-1]] = dictRecord["value"]
+   return dictNested
+
+def _InitChunkProcess():
+   """
+Initialization of a forked process of the parallel rendering: the signal handlers of the parent process
+(e.g. the ones of the Robot Framework) are not valid within this process.
+   """
+   signal.signal(signal.SIGTERM, signal.SIG_DFL)
+   signal.signal(signal.SIGINT, signal.SIG_IGN) # the parent process handles the interruption
+
+def _RenderChunk(tupleRange=None):
+   """
+Renders the elements ``tupleRange`` (start index, end index) of the top level container of the current parallel job
+(executed within a forked process).
+   """
+   oTypeRenderer, oData = _tupleParallelJob
+   return list(oTypeRenderer._Walk(oData, "", False, tupleRange))
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CTypeRenderer(object):
+   """
+The class ``CTypeRenderer`` computes the pretty print lines of any Python data.
+
+The data structure is traversed iteratively (no recursion; therefore also very deeply nested data can be rendered)
+and the lines are provided by a generator. Containers are tracked by their identity: a container that contains itself
+(directly or indirectly) is rendered as back-reference (instead of an endless recursion). The traversal stops as soon
+as a limit is reached. Elements that are not rendered because of a limit, are summarized within a separate line
+(e.g. ``[LIST] ... 499,000 more items``).
+   """
+
+   def __init__(self, nMaxDepth=None, nMaxItems=None, nMaxLines=None, nHead=None, nTail=None, nSample=None, nSeed=0, bShareSubtrees=False, fTimeout=None, nMaxBytes=None):
+      """
+**Arguments:**
+
+* ``nMaxDepth``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of nested container levels to be resolved. Deeper containers are summarized. ``None`` means no limit.
+
+* ``nMaxItems``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of elements to be rendered per container. ``None`` means no limit.
+
+* ``nMaxLines``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of lines to be rendered. ``None`` means no limit.
+
+* ``nHead``, ``nTail``, ``nSample``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Sampling mode: per container only the first ``nHead`` elements, the last ``nTail`` elements and a random sample
+  of ``nSample`` elements out of the remaining elements in between are rendered. The elements keep their original
+  counter numbers. ``None`` for all three parameters means: no sampling.
+
+* ``nSeed``
+
+  / *Condition*: optional / *Type*: int / *Default*: 0 /
+
+  Seed of the random sample (the same seed selects the same elements of the same data).
+
+* ``bShareSubtrees``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, a container that is referenced several times within the data, is rendered only at the first reference.
+  All further references are rendered as one line pointing to the first one.
+
+* ``fTimeout``
+
+  / *Condition*: optional / *Type*: float / *Default*: None /
+
+  Time budget in seconds (wall clock time, measured from the first line on and including the processing of the lines
+  by the caller). No further lines are rendered after the budget is exceeded. ``None`` means no limit.
+
+* ``nMaxBytes``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of characters to be rendered (line breaks included; records: the values only). ``None`` means no limit.
+
+The reason of a truncated output is available in ``sTruncated`` after the rendering (``None`` in case of the output is complete).
+      """
+      self.nMaxDepth = nMaxDepth
+      self.nMaxItems = nMaxItems
+      self.nMaxLines = nMaxLines
+      self.nHead     = nHead
+      self.nTail     = nTail
+      self.nSample   = nSample
+      self.nSeed     = nSeed
+      self.bSampling = (nHead is not None) or (nTail is not None) or (nSample is not None)
+      self.oRandom   = None
+      self.bShareSubtrees = bShareSubtrees
+      self.fTimeout  = fTimeout
+      self.nMaxBytes = nMaxBytes
+      self.nLines    = 0    # number of lines rendered by the last call of 'Render'
+      self.nBytes    = 0    # number of characters rendered by the last call of 'Render'
+      self.sTruncated = None # reason of the truncation of the output of the last call of 'Render'
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _SelectIndices(self, nNrOfElements=0):
+      """
+Returns the sorted list of indices of the elements of a container with ``nNrOfElements`` elements, that are selected
+by the sampling mode - or ``None`` in case of all elements are selected.
+
+The computation time depends on the size of the sample only (and not on the size of the container).
+      """
+      nHead   = self.nHead or 0
+      nTail   = self.nTail or 0
+      nSample = self.nSample or 0
+      if nHead + nTail + nSample >= nNrOfElements:
+         return None
+      listIndices = list(range(nHead))
+      if nSample > 0:
+         listIndices.extend(sorted(self.oRandom.sample(range(nHead, nNrOfElements - nTail), nSample)))
+      listIndices.extend(range(nNrOfElements - nTail, nNrOfElements))
+      return listIndices
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _IterElements(self, oData, sTypeTag, sContainerPrefix):
+      """
+Generator providing the elements of a container as tuples ``(sElementPrefix, oElement, bSummary, nIndex, oKey)``
+(``oKey``: key of the element in case of dictionaries, ``None`` otherwise).
+
+In case of ``bSummary`` is ``True``, ``sElementPrefix`` is a complete summary line and all other values are not relevant.
+      """
+      nNrOfElements = len(oData)
+      bMapping      = sTypeTag in setMappingTags
+
+      listIndices = None
+      if self.bSampling is True:
+         listIndices = self._SelectIndices(nNrOfElements)
+
+      if listIndices is None:
+         nNrOfShown = nNrOfElements
+         if (self.nMaxItems is not None) and (self.nMaxItems < nNrOfElements):
+            nNrOfShown = self.nMaxItems
+
+         nCnt = 0
+         if bMapping is True:
+            for oKey, oValue in islice(oData.items(), nNrOfShown):
+               yield f"{sContainerPrefix} ({nNrOfElements}/{nCnt + 1}) > {{{oKey}}}", oValue, False, nCnt, oKey
+               nCnt = nCnt + 1
+         else:
+            for oElement in islice(oData, nNrOfShown):
+               yield f"{sContainerPrefix} ({nNrOfElements}/{nCnt + 1}) >", oElement, False, nCnt, None
+               nCnt = nCnt + 1
+
+         if nNrOfShown < nNrOfElements:
+            yield f"{sContainerPrefix} ... {nNrOfElements - nNrOfShown:,} more items", None, True, None, None
+         return
+
+      # -- sampling mode
+      if (self.nMaxItems is not None) and (self.nMaxItems < len(listIndices)):
+         listIndices = listIndices[:self.nMaxItems]
+      if bMapping is True:
+         oElements = list(oData.items()) # dictionaries and sets cannot be accessed by index
+      elif type(oData) in (list, tuple):
+         oElements = oData
+      else:
+         oElements = list(oData)
+
+      nNext = 0 # index of the next element without gap
+      for nIndex in listIndices:
+         if nIndex > nNext:
+            yield f"{sContainerPrefix} ... {nIndex - nNext:,} more items", None, True, None, None
+         if bMapping is True:
+            oKey, oValue = oElements[nIndex]
+            yield f"{sContainerPrefix} ({nNrOfElements}/{nIndex + 1}) > {{{oKey}}}", oValue, False, nIndex, oKey
+         else:
+            yield f"{sContainerPrefix} ({nNrOfElements}/{nIndex + 1}) >", oElements[nIndex], False, nIndex, None
+         nNext = nIndex + 1
+      if nNext < nNrOfElements:
+         yield f"{sContainerPrefix} ... {nNrOfElements - nNext:,} more items", None, True, None, None
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _IterRange(self, oData, sTypeTag, sContainerPrefix, nStart, nEnd):
+      """
+Generator providing the elements ``nStart`` up to ``nEnd`` (exclusive) of a container in the same way like ``_IterElements``
+(parallel rendering: every process renders a range of elements of the top level container).
+      """
+      nNrOfElements = len(oData)
+      if sTypeTag in setMappingTags:
+         for nIndex, (oKey, oValue) in enumerate(islice(oData.items(), nStart, nEnd), nStart):
+            yield f"{sContainerPrefix} ({nNrOfElements}/{nIndex + 1}) > {{{oKey}}}", oValue, False, nIndex, oKey
+      else:
+         for nIndex, oElement in enumerate(islice(oData, nStart, nEnd), nStart):
+            yield f"{sContainerPrefix} ({nNrOfElements}/{nIndex + 1}) >", oElement, False, nIndex, None
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _RenderLeaf(self, oData, sTypeTag, sPrefix):
+      """
+Returns the line of a simple data type (or of an empty container).
+      """
+      if sTypeTag in dictEmptyValues:
+         sValue = dictEmptyValues[sTypeTag]
+      elif sTypeTag in ("[NONE]", "[INT]", "[FLOAT]", "[BOOL]"):
+         sValue = str(oData)
+      elif sTypeTag != "[STR]":
+         sValue = GetSummary(oData)
+         if sValue is None:
+            sValue = "'" + str(oData) + "'"
+      else:
+         sValue = "'" + str(oData) + "'"
+      if sPrefix == "":
+         return f"{sTypeTag}  :  {sValue}"
+      return f"{sPrefix} {sTypeTag}  :  {sValue}"
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _NewRecord(self, listPath, listParents, nIndex, sTypeTag, oValue):
+      """
+Returns the record of the current element (see ``RenderRecords``).
+      """
+      if len(listParents) == 0:
+         return {"path" : [], "type" : sTypeTag, "count" : None, "index" : None, "value" : oValue}
+      return {"path" : list(listPath), "type" : sTypeTag, "count" : listParents[-1][1], "index" : nIndex, "value" : oValue}
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Render(self, oData=None, sPrefix=""):
+      """
+Generator providing the pretty print lines of ``oData``.
+
+**Arguments:**
+
+* ``oData``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  Data to be rendered
+
+* ``sPrefix``
+
+  / *Condition*: optional / *Type*: str / *Default*: "" /
+
+  Path of ``oData`` within a surrounding data structure (in case of only a part of a data structure is rendered)
+
+**Returns:**
+
+* ``sLine``
+
+  / *Type*: str /
+
+  The next line of output (generator)
+      """
+      return self._Walk(oData, sPrefix, False)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def RenderRecords(self, oData=None):
+      """
+Generator providing the content of ``oData`` as records (one dictionary per line of the text output; same traversal,
+same limits). Every record contains:
+
+* ``path``: list of the keys (dictionaries) and indices (all other containers) from the top level down to the element
+* ``type``: type tag of the element
+* ``count``: number of elements of the surrounding container (``None`` at top level)
+* ``index``: index of the element within the surrounding container (``None`` at top level)
+* ``value``: value of the element (see ``GetRecordValue``)
+
+Lines without element (e.g. ``... 10 more items``) are provided as records with ``note`` instead of ``value``
+(``path`` and ``type`` of these records belong to the surrounding container).
+      """
+      return self._Walk(oData, "", True)
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def RenderParallel(self, oData=None, nProcesses=None, nThreshold=100000):
+      """
+Generator providing the same lines as ``Render`` - computed by several processes: the elements of the top level container
+are split into chunks, the chunks are rendered by a process pool and the lines of all chunks are provided in the original order.
+
+The lines are computed serially (by ``Render``) in case of:
+
+* the top level data is not a container with at least ``nThreshold`` elements (the start of the processes
+  takes longer than the rendering of small data),
+* ``nProcesses`` is less than 2,
+* a limit, a budget, the sampling mode or ``bShareSubtrees`` is used (these features depend on the complete output),
+* the operating system does not support ``fork`` (the processes inherit the data; the data is not serialized).
+      """
+      global _tupleParallelJob
+
+      sTypeTag = GetTypeTag(oData)
+      bParallel = ( (sTypeTag in setSequenceTags) or (sTypeTag in setMappingTags) ) and (len(oData) >= max(nThreshold, 1)) \
+                  and (nProcesses is not None) and (nProcesses > 1) \
+                  and (self.bSampling is False) and (self.bShareSubtrees is False) \
+                  and (self.nMaxDepth is None) and (self.nMaxItems is None) and (self.nMaxLines is None) \
+                  and (self.fTimeout is None) and (self.nMaxBytes is None)
+      if bParallel is True:
+         import multiprocessing # imported with the first parallel rendering only (import time of the library)
+         bParallel = "fork" in multiprocessing.get_all_start_methods()
+      if bParallel is False:
+         yield from self.Render(oData)
+         return
+
+      self.nLines     = 0
+      self.nBytes     = 0
+      self.sTruncated = None
+      nNrOfElements   = len(oData)
+      nNrOfChunks     = nProcesses * CHUNKS_PER_PROCESS
+      nChunkSize      = -(-nNrOfElements // nNrOfChunks)
+      listRanges      = [(nStart, min(nStart + nChunkSize, nNrOfElements)) for nStart in range(0, nNrOfElements, nChunkSize)]
+
+      _tupleParallelJob = (self, oData)
+      try:
+         oPool = multiprocessing.get_context("fork").Pool(nProcesses, initializer=_InitChunkProcess)
+      finally:
+         _tupleParallelJob = None # the forked processes already own their copy
+      try:
+         for listLines in oPool.imap(_RenderChunk, listRanges):
+            self.nLines = self.nLines + len(listLines)
+            yield from listLines
+         oPool.close()
+      finally:
+         oPool.terminate() # in case of the caller stops earlier
+         oPool.join()
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def _Walk(self, oData, sPrefix, bRecords, tupleRange=None):
+      """
+Generator behind ``Render`` (``bRecords`` is ``False``: lines) and ``RenderRecords`` (``bRecords`` is ``True``: records).
+
+``tupleRange`` (start index, end index): only this range of elements of the top level container is rendered
+(see ``RenderParallel``).
+      """
+      self.nLines     = 0
+      self.nBytes     = 0
+      self.sTruncated = None
+      fDeadline       = None if self.fTimeout is None else time.perf_counter() + self.fTimeout
+      if self.bSampling is True:
+         self.oRandom = random.Random(self.nSeed)
+      listFrames   = []    # stack of the element generators of all containers currently under rendering
+      listFrameIds = []    # identities of these containers
+      dictActive   = {}    # identity -> path of all containers currently under rendering (cycle detection)
+      dictRendered = {}    # identity -> (container, path) of all already rendered containers (shared subtrees)
+      oCurrent     = oData # current element; sPrefix is the path from the top level data down to this element
+      bVisit       = True  # the current element still has to be rendered
+      listPath     = []    # records only: keys/indices of the current element (path)
+      listParents  = []    # records only: (type tag, number of elements) of all containers currently under rendering
+      nIndex       = None  # records only: index of the current element
+
+      while True:
+         sLine = None
+         if bVisit is True:
+            sTypeTag = GetTypeTag(oCurrent)
+            sMessage = None # replaces the value of a container that is not resolved
+            if ( (sTypeTag in setSequenceTags) or (sTypeTag in setMappingTags) ) and (len(oCurrent) > 0):
+               if (self.nMaxDepth is not None) and (len(listFrames) >= self.nMaxDepth):
+                  sMessage = f"... {len(oCurrent):,} items not shown (max depth reached)"
+               elif id(oCurrent) in dictActive:
+                  sMessage = f"<cycle: back-reference to {dictActive[id(oCurrent)]}>"
+               elif id(oCurrent) in dictRendered:
+                  sMessage = f"<shared: already printed at {dictRendered[id(oCurrent)][1]}>"
+               else:
+                  sContainerPrefix = sTypeTag if sPrefix == "" else f"{sPrefix} {sTypeTag}"
+                  if (tupleRange is not None) and (len(listFrames) == 0):
+                     listFrames.append(self._IterRange(oCurrent, sTypeTag, sContainerPrefix, *tupleRange))
+                  else:
+                     listFrames.append(self._IterElements(oCurrent, sTypeTag, sContainerPrefix))
+                  listFrameIds.append(id(oCurrent))
+                  dictActive[id(oCurrent)] = sPrefix if sPrefix != "" else "top level"
+                  if self.bShareSubtrees is True:
+                     dictRendered[id(oCurrent)] = (oCurrent, dictActive[id(oCurrent)]) # reference keeps the identity valid
+                  if bRecords is True:
+                     listParents.append((sTypeTag, len(oCurrent)))
+                     listPath.append(None) # placeholder for the keys/indices of the elements
+               if sMessage is None:
+                  pass
+               elif bRecords is True:
+                  sLine = self._NewRecord(listPath, listParents, nIndex, sTypeTag, sMessage)
+               elif sPrefix == "":
+                  sLine = f"{sTypeTag}  :  {sMessage}"
+               else:
+                  sLine = f"{sPrefix} {sTypeTag}  :  {sMessage}"
+            elif bRecords is True:
+               sLine = self._NewRecord(listPath, listParents, nIndex, sTypeTag, GetRecordValue(oCurrent, sTypeTag))
+            else:
+               sLine = self._RenderLeaf(oCurrent, sTypeTag, sPrefix)
+            bVisit = False
+         elif len(listFrames) == 0:
+            return
+         else:
+            tupleNext = next(listFrames[-1], None)
+            if tupleNext is None:
+               del listFrames[-1] # container completely rendered
+               del dictActive[listFrameIds.pop()]
+               if bRecords is True:
+                  listParents.pop()
+                  listPath.pop()
+               continue
+            sElementPrefix, oElement, bSummary, nIndex, oKey = tupleNext
+            if bSummary is True:
+               sLine = sElementPrefix
+               if bRecords is True:
+                  sTypeTag, nCount = listParents[-1]
+                  sLine = {"path" : listPath[:-1], "type" : sTypeTag, "count" : nCount, "note" : sLine[sLine.rindex(" ... ") + 1:]}
+            else:
+               sPrefix  = sElementPrefix
+               oCurrent = oElement
+               bVisit   = True
+               if bRecords is True:
+                  listPath[-1] = oKey if listParents[-1][0] in setMappingTags else nIndex
+               continue
+
+         if sLine is not None:
+            if (self.nMaxLines is not None) and (self.nLines >= self.nMaxLines):
+               self.sTruncated = "max lines reached"
+            elif (fDeadline is not None) and (time.perf_counter() > fDeadline):
+               self.sTruncated = f"time budget of {self.fTimeout} s exceeded"
+            elif self.nMaxBytes is not None:
+               nBytes = len(sLine) + 1 if bRecords is False else len(str(sLine.get("value", sLine.get("note")))) + 1
+               if self.nBytes + nBytes > self.nMaxBytes:
+                  self.sTruncated = f"max bytes ({self.nMaxBytes:,}) reached"
+               else:
+                  self.nBytes = self.nBytes + nBytes
+            if self.sTruncated is not None:
+               sNote = f"... output truncated after {self.nLines:,} lines ({self.sTruncated})"
+               yield {"path" : [], "type" : None, "count" : None, "note" : sNote} if bRecords is True else sNote
+               return
+            self.nLines = self.nLines + 1
+            yield sLine
+
+   # eof def _Walk(self, oData, sPrefix, bRecords, tupleRange=None):
+
+# eof class CTypeRenderer(object):
+
+# --------------------------------------------------------------------------------------------------------------
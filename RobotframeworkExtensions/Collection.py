@@ -38,16 +38,18 @@ This library containing the keyword definitions, can be imported in the followin
 """
 
 # -- import standard Python modules
-import pickle, os, time, random
+import os, json
+from collections import OrderedDict
 
 # -- import Robotframework API
 from robot.api.deco import keyword, library # required when using @keyword, @library decorators
-from robot.libraries.BuiltIn import BuiltIn
+from robot.libraries.BuiltIn import BuiltIn, RobotNotRunningError
 
 # -- import own Python modules
-from PythonExtensionsCollection.Utils.CUtils import *
-from PythonExtensionsCollection.String.CString import CString
-
+# (the modules behind the keywords - renderer, diff, hash, tree index - are imported with the first usage of the keywords;
+# every suite and every parallel process imports this library, but usually uses some of the keywords only)
+from RobotframeworkExtensions.CPathCache import CPathCache
+from RobotframeworkExtensions.CKeywordMetadata import LoadKeywordMetadata, METADATA_FILE
 from RobotframeworkExtensions.version import VERSION
 from RobotframeworkExtensions.version import VERSION_DATE
 
@@ -58,6 +60,15 @@ sThisModuleVersion = VERSION
 sThisModuleDate    = VERSION_DATE
 sThisModule        = sThisModuleName + " v. " + sThisModuleVersion + " / " + sThisModuleDate
 
+# -- possible destinations of the output of the pretty_print keyword
+listOutputSinks = ["log", "console", "both", "none"]
+
+# -- possible formats of output files
+listFileFormats = ["text", "jsonl"]
+
+# -- possible formats of the output of the pretty_print keyword
+listOutputFormats = ["text", "jsonl", "dict"]
+
 # --------------------------------------------------------------------------------------------------------------
 #
 @library
@@ -69,11 +80,146 @@ class Collection(object):
     ROBOT_LIBRARY_VERSION = sThisModuleVersion
     ROBOT_LIBRARY_SCOPE   = 'GLOBAL'
 
+    dictKeywordMetadata = None # keyword metadata (loaded once per process; see '_GetKeywordMetadata')
+
     # --------------------------------------------------------------------------------------------------------------
     #TM***
 
-    def __init__(self, sThisModule=sThisModule):
-        self.sThisModule = sThisModule # in case of debugging
+    def __init__(self, sThisModule=sThisModule, bAsyncConsole=False, nConsoleQueueSize=10000, nHashCacheSize=10000, nLabelCacheSize=1000, fTimeout=None, nMaxBytes=None, nPathCacheSize=1000, sPathEngine="native", bTiming=False, oProfileKeywords=None, nProfileTop=10, sSharedState=None):
+        """
+**Arguments:**
+
+* ``bAsyncConsole``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the console output of the keywords is written asynchronously by a background thread (the keywords
+  do not wait for the console). The console output is flushed at the end of every test and every suite, and with
+  the keyword ``flush_console``.
+
+* ``nConsoleQueueSize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 10000 /
+
+  Maximum number of console outputs waiting for the background thread (``bAsyncConsole``). In case of the
+  limit is reached, the keywords wait for the console.
+
+* ``nHashCacheSize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 10000 /
+
+  Maximum number of immutable objects (tuples, long strings) whose hashes are cached by the keyword ``fingerprint``.
+  ``0`` disables the cache.
+
+* ``nLabelCacheSize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 1000 /
+
+  Maximum number of labels whose last printed content is remembered by the keyword ``pretty_print`` (``bSkipUnchanged``).
+  In case of the limit is reached, the least recently used label is forgotten.
+
+* ``fTimeout``, ``nMaxBytes``
+
+  / *Condition*: optional / *Type*: float, int / *Default*: None /
+
+  Default budgets of the keyword ``pretty_print`` (time in seconds, size in characters). ``None`` means no limit.
+
+* ``nPathCacheSize``
+
+  / *Condition*: optional / *Type*: int / *Default*: 1000 /
+
+  Maximum number of paths whose normalized versions are cached by the keyword ``normalize_path``. ``0`` disables the cache.
+
+* ``sPathEngine``
+
+  / *Condition*: optional / *Type*: str / *Default*: "native" /
+
+  Default path normalization engine of the keywords ``normalize_path`` and ``normalize_paths``: ``native``
+  (implementation of this library) or ``cstring`` (``CString.NormalizePath`` of the PythonExtensionsCollection).
+  Both engines compute the same results.
+
+* ``bTiming``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the calls of all keywords of this library are measured: number of calls, total, minimum, maximum and
+  95th percentile of the duration (histogram with a relative error below 3 %), number of characters logged. At the end
+  of the execution the results are written to a JSON file next to the ``output.xml`` (``<name of output file>_keyword_timing.json``).
+
+* ``oProfileKeywords``
+
+  / *Condition*: optional / *Type*: str, list / *Default*: None /
+
+  Keywords to be profiled with ``cProfile`` and ``tracemalloc`` (all keywords of the suites using this library, not only the keywords
+  of this library): list or comma separated string of keyword names or glob patterns (e.g. ``rf.extensions.*``); ``*`` profiles all
+  keywords. The results are written per test to the subfolder ``profiles`` of the output directory: ``<test>.prof`` (``cProfile``
+  statistics) and ``<test>.alloc.txt`` (calls and peak memory per keyword, top allocations). ``None`` disables the profiling
+  (the listener is not registered; no overhead).
+
+* ``nProfileTop``
+
+  / *Condition*: optional / *Type*: int / *Default*: 10 /
+
+  Number of source lines with the most memory allocated listed in ``<test>.alloc.txt`` (``oProfileKeywords``).
+
+* ``sSharedState``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Path and name of an SQLite database shared by the processes of a parallel execution (e.g. with pabot). Relative paths are relative
+  to the output directory (with pabot: the output directory of pabot, not the output directories of the single processes).
+  Every process starts with the paths already normalized by the processes before (``normalize_path``, ``nPathCacheSize``) and adds
+  its own ones at the end. With ``bTiming`` the timing of all processes of the test execution is combined in one report next to the
+  database (``<name of database>_keyword_timing.json``). The processes of a test execution are identified by the environment variable
+  ``RFE_SHARED_STATE_RUN`` (to be set by the launcher of the processes); without this variable: the processes of one pabot execution,
+  otherwise this process only. ``None``: no shared state.
+        """
+        self.sThisModule    = sThisModule # in case of debugging
+        self.oBuiltIn       = BuiltIn()   # one instance for all outputs (instead of a new one per line)
+        self.oConsoleWriter = None
+        self.nOutputFiles   = 0           # number of output files written by this library instance
+        self.nBytesLogged   = 0           # number of characters logged by the keywords of this library instance
+        self.oTypeHash      = None        # created with the first usage (see '_GetTypeHash')
+        self.nHashCacheSize  = int(nHashCacheSize)
+        self.nLabelCacheSize = int(nLabelCacheSize)
+        self.dictLastPrinted = OrderedDict() # label -> (fingerprint, options) of the last output of 'pretty_print' (LRU)
+        self.fTimeout        = self._GetBudget(fTimeout, "fTimeout")
+        self.nMaxBytes       = self._GetLimit(nMaxBytes, "nMaxBytes")
+        self.oSharedState    = None
+        if sSharedState is not None:
+           from RobotframeworkExtensions.CSharedState import CSharedState
+           self.oSharedState = CSharedState(self._GetSharedStateFile(sSharedState), self._GetSharedStateRun())
+        self.oPathCache      = CPathCache(nCacheSize=int(nPathCacheSize), oSharedState=self.oSharedState)
+        self.sPathEngine     = str(sPathEngine).lower()
+        listListeners       = []
+        if bAsyncConsole is True:
+           from RobotframeworkExtensions.CConsoleWriter import CConsoleWriter
+           self.oConsoleWriter = CConsoleWriter(int(nConsoleQueueSize))
+           listListeners.append(self.oConsoleWriter)
+        self.oKeywordTimer = None
+        if bTiming is True:
+           from RobotframeworkExtensions.CKeywordTimer import CKeywordTimer
+           self.oKeywordTimer = CKeywordTimer(self._GetTimingReportFile())
+           for sName in dir(type(self)):
+              oMethod = getattr(self, sName)
+              if hasattr(oMethod, "robot_name"): # keyword: replaced by the measuring wrapper (for this instance only)
+                 setattr(self, sName, self.oKeywordTimer.Wrap(oMethod.robot_name or sName, oMethod, lambda: self.nBytesLogged))
+           listListeners.append(self.oKeywordTimer)
+           if self.oSharedState is not None:
+              sCombinedReportFile = f"{os.path.splitext(self.oSharedState.sDatabaseFile)[0]}_keyword_timing.json"
+              self.oSharedState.AddCloseHandler(lambda: self.oKeywordTimer.WriteCombinedReport(self.oSharedState, sCombinedReportFile))
+        if oProfileKeywords is not None:
+           from RobotframeworkExtensions.CKeywordProfiler import CKeywordProfiler
+           if isinstance(oProfileKeywords, str):
+              oProfileKeywords = [sPattern.strip() for sPattern in oProfileKeywords.split(",") if sPattern.strip() != ""]
+           sOutputDir, _ = self._GetOutputLocation()
+           listListeners.append(CKeywordProfiler(os.path.join(sOutputDir, "profiles"), oProfileKeywords, int(nProfileTop)))
+        if self.oSharedState is not None:
+           listListeners.append(self.oSharedState) # the data of this process is written at the end
+        if len(listListeners) > 0:
+           self.ROBOT_LIBRARY_LISTENER = listListeners
+        # keyword name -> bound method (after the keywords have been replaced by the measuring wrapper, 'bTiming')
+        self.dictKeywordMethods = {sName: getattr(self, dictKeyword["method"]) for sName, dictKeyword in self._GetKeywordMetadata()["keywords"].items()}
 
     def __del__(self):
         pass
@@ -81,8 +227,289 @@ class Collection(object):
     # --------------------------------------------------------------------------------------------------------------
     #TM***
 
+    def _WriteToConsole(self, sText=None):
+       """
+Writes ``sText`` to the console - either directly or with the background thread (``bAsyncConsole``).
+       """
+       if self.oConsoleWriter is not None:
+          self.oConsoleWriter.Write(sText)
+       else:
+          self.oBuiltIn.log_to_console(sText)
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetOutputLocation(self):
+       """
+Returns the output directory and the output file (``NONE``: no output file) of the Robot Framework.
+       """
+       try:
+          sOutputDir  = self.oBuiltIn.get_variable_value("${OUTPUT DIR}", os.getcwd())
+          sOutputFile = self.oBuiltIn.get_variable_value("${OUTPUT FILE}", "NONE")
+       except RobotNotRunningError:
+          sOutputDir  = os.getcwd()
+          sOutputFile = "NONE"
+       return sOutputDir, sOutputFile
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetSharedStateFile(self, sSharedState=None):
+       """
+Returns the path and name of the shared state database (``sSharedState``; relative paths: relative to the output directory).
+
+The processes of pabot write to ``<output directory>/pabot_results/<index>``; therefore relative paths are relative to the
+output directory of pabot in this case (identified by the variable ``${PABOTQUEUEINDEX}``).
+       """
+       if os.path.isabs(sSharedState) is True:
+          return sSharedState
+       sOutputDir, _ = self._GetOutputLocation()
+       if self._IsPabot() is True:
+          sOutputDir = os.path.dirname(os.path.dirname(os.path.abspath(sOutputDir)))
+       return os.path.join(sOutputDir, sSharedState)
+
+    def _GetSharedStateRun(self):
+       """
+Returns the identifier of the test execution this process belongs to (``sSharedState``: the keyword timing of all processes of
+a test execution is combined): the environment variable ``RFE_SHARED_STATE_RUN`` (set by the launcher of the processes), with
+pabot the pabot process (parent process of all processes of a pabot execution), otherwise ``None`` (this process only).
+       """
+       sRun = os.environ.get("RFE_SHARED_STATE_RUN")
+       if (sRun is None) and (self._IsPabot() is True):
+          sRun = f"pabot:{os.getppid()}"
+       return sRun
+
+    def _IsPabot(self):
+       """
+Returns ``True`` in case of this process is started by pabot (identified by the variable ``${PABOTQUEUEINDEX}``).
+       """
+       try:
+          return self.oBuiltIn.get_variable_value("${PABOTQUEUEINDEX}") is not None
+       except RobotNotRunningError:
+          return False
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetTimingReportFile(self):
+       """
+Returns the path and name of the timing report (``bTiming``): next to the output file of the Robot Framework.
+       """
+       sOutputDir, sOutputFile = self._GetOutputLocation()
+       if str(sOutputFile).upper() == "NONE":
+          return os.path.join(sOutputDir, "keyword_timing.json")
+       return f"{os.path.splitext(sOutputFile)[0]}_keyword_timing.json"
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetTypeHash(self):
+       """
+Returns the ``CTypeHash`` instance of this library instance (created with the first usage).
+       """
+       if self.oTypeHash is None:
+          from RobotframeworkExtensions.CTypeHash import CTypeHash
+          self.oTypeHash = CTypeHash(nCacheSize=self.nHashCacheSize)
+       return self.oTypeHash
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _EmitLines(self, oLines, bBlockMode=False, sSink="both"):
+       """
+Sends the lines computed by a keyword (``oLines``: any iterable of strings, e.g. a generator) to the requested
+output sink (``sSink``: ``log``, ``console``, ``both`` or ``none``) and returns them as list.
+
+In block mode (``bBlockMode``) all lines are joined and written with a single log message and a single console write,
+otherwise every line is written separately - as soon as it is provided by ``oLines``.
+       """
+       bLog     = sSink in ("log", "both")
+       bConsole = sSink in ("console", "both")
+       if ( (bLog is False) and (bConsole is False) ) or (bBlockMode is True):
+          listOutLines = list(oLines)
+          if ( (bLog is True) or (bConsole is True) ) and (len(listOutLines) > 0):
+             sBlock = "\n".join(listOutLines)
+             if bLog is True:
+                self.oBuiltIn.log(sBlock, "INFO")
+                self.nBytesLogged = self.nBytesLogged + len(sBlock)
+             if bConsole is True:
+                self._WriteToConsole(sBlock)
+       else:
+          listOutLines = []
+          for sLine in oLines:
+             if bLog is True:
+                self.oBuiltIn.log(sLine, "INFO")
+                self.nBytesLogged = self.nBytesLogged + len(sLine)
+             if bConsole is True:
+                self._WriteToConsole(sLine)
+             listOutLines.append(sLine)
+       return listOutLines
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _EmitLinesToFile(self, oLines, sFile=None, sFileFormat="text", bGzip=False):
+       """
+Writes the lines computed by a keyword (``oLines``: any iterable of strings, e.g. a generator) incrementally to a file
+and logs a summary with a link to this file. Only one line is kept in memory at a time.
+
+Relative paths (``sFile``) are relative to the output directory of the Robot Framework. Without ``sFile``
+the file is written to the subfolder ``pretty_print`` of the output directory.
+
+``sFileFormat``: ``text`` and ``jsonl`` (see ``pretty_print``), or ``records`` (the lines already are JSON objects;
+written unchanged to a ``.jsonl`` file).
+
+Returns the path and name of the file.
+       """
+       sOutputDir, _ = self._GetOutputLocation()
+       if sFile is None:
+          self.nOutputFiles = self.nOutputFiles + 1
+          sExtension = "txt" if sFileFormat == "text" else "jsonl" # 'records': lines already are JSON objects
+          sFile = os.path.join(sOutputDir, "pretty_print", f"pretty_print_{os.getpid()}_{self.nOutputFiles:04d}.{sExtension}")
+       elif os.path.isabs(sFile) is False:
+          sFile = os.path.join(sOutputDir, sFile)
+       if (bGzip is True) and (sFile.endswith(".gz") is False):
+          sFile = f"{sFile}.gz"
+       sFile = self.oPathCache.NormalizePath(sFile, sEngine=self.sPathEngine)
+       os.makedirs(os.path.dirname(sFile), exist_ok=True)
+
+       nLines = 0
+       nBytes = 0
+       if bGzip is True:
+          import gzip
+          oFile = gzip.open(sFile, "wt", encoding="utf-8")
+       else:
+          oFile = open(sFile, "w", encoding="utf-8")
+       with oFile:
+          for sLine in oLines:
+             if sFileFormat == "jsonl":
+                sLine = json.dumps({"line" : sLine}, ensure_ascii=False)
+             oFile.write(sLine + "\n")
+             nLines = nLines + 1
+             nBytes = nBytes + len(sLine) + 1
+
+       try:
+          sLink = os.path.relpath(sFile, sOutputDir).replace("\\", "/")
+       except ValueError:
+          sLink = sFile # e.g. other drive under Windows
+       self.oBuiltIn.log(f"{nLines} lines ({nBytes} characters) written to <a href=\"{sLink}\">{sLink}</a>", "INFO", html=True)
+       return sFile
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _SkipUnchanged(self, oData, sPrefix, sLabel, sSink, bBlockMode, tupleOptions):
+       """
+Compares the fingerprint of ``oData`` with the fingerprint of the last output with the same label (``sLabel``,
+default: ``sPrefix``) and remembers the new fingerprint.
+
+In case of ``oData`` is unchanged, the ``unchanged`` line is written and returned (list with one line), otherwise ``None``.
+       """
+       if sLabel is None:
+          sLabel = sPrefix
+       try:
+          tupleLastPrinted = (self._GetTypeHash().Hash(oData), tupleOptions)
+       finally:
+          self.oTypeHash.Clear() # mutable containers may change until the next call
+       bUnchanged = self.dictLastPrinted.get(sLabel) == tupleLastPrinted
+       self.dictLastPrinted[sLabel] = tupleLastPrinted
+       self.dictLastPrinted.move_to_end(sLabel)
+       if len(self.dictLastPrinted) > self.nLabelCacheSize:
+          self.dictLastPrinted.popitem(last=False)
+       if bUnchanged is False:
+          return None
+       sLine = "<unchanged since last print>"
+       if sPrefix is not None:
+          sLine = f"{sPrefix} : {sLine}"
+       return self._EmitLines([sLine], bBlockMode, "log" if sSink == "file" else sSink)
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetBudget(self, fBudget=None, sName=None):
+       """
+Returns the time budget ``fBudget`` as float (``None`` means no limit).
+       """
+       if fBudget is None:
+          return None
+       fBudget = float(fBudget)
+       if fBudget <= 0:
+          raise ValueError(f"Invalid value {fBudget} of parameter '{sName}'. Expected value > 0")
+       return fBudget
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _CheckBudget(self, oTypeRenderer=None, bFailOnBudget=False):
+       """
+Fails in case of ``bFailOnBudget`` is ``True`` and the output of ``oTypeRenderer`` is truncated because of a budget.
+       """
+       sTruncated = oTypeRenderer.sTruncated
+       if (bFailOnBudget is True) and (sTruncated is not None) and (sTruncated != "max lines reached"):
+          raise AssertionError(f"Output of 'pretty_print' truncated after {oTypeRenderer.nLines:,} lines ({sTruncated})")
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    def _GetLimit(self, nLimit=None, sName=None):
+       """
+Converts the limit ``nLimit`` (maybe given as string within robot files) to an integer and checks the value.
+``None`` means no limit.
+       """
+       if nLimit is None:
+          return None
+       nLimit = int(nLimit)
+       if nLimit < 0:
+          raise ValueError(f"Invalid value {nLimit} of parameter '{sName}'. Expected value >= 0")
+       return nLimit
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+    #
+    # dynamic library API: the keyword metadata is computed at build time (see 'CKeywordMetadata'); loading the library
+    # and libdoc do not need to introspect the keyword methods
+
+    def _GetKeywordMetadata(self):
+       """
+Returns the keyword metadata of this library (``Collection.keywords.json``; computed by introspection in case of the file is missing or outdated).
+       """
+       dictMetadata = Collection.dictKeywordMetadata
+       if dictMetadata is None:
+          sSourceFile  = os.path.abspath(__file__)
+          dictMetadata = LoadKeywordMetadata(Collection, sSourceFile, os.path.join(os.path.dirname(sSourceFile), METADATA_FILE))
+          Collection.dictKeywordMetadata = dictMetadata
+       return dictMetadata
+
+    def get_keyword_names(self):
+       return list(self._GetKeywordMetadata()["keywords"])
+
+    def run_keyword(self, name, args, kwargs):
+       return self.dictKeywordMethods[name](*args, **kwargs)
+
+    def get_keyword_arguments(self, name):
+       return self._GetKeywordMetadata()["keywords"][name]["args"]
+
+    def get_keyword_types(self, name):
+       # never 'None': 'None' disables the argument conversion completely; with types (maybe empty) the Robot Framework
+       # converts the arguments also based on their default values (e.g. 'bUnique=True' -> bool), like with the static API
+       return self._GetKeywordMetadata()["keywords"][name]["types"]
+
+    def get_keyword_documentation(self, name):
+       dictMetadata = self._GetKeywordMetadata()
+       if name == "__intro__":
+          return dictMetadata["intro"]
+       if name == "__init__":
+          return dictMetadata["init"]
+       return dictMetadata["keywords"][name]["doc"]
+
+    def get_keyword_source(self, name):
+       return f"{os.path.abspath(__file__)}:{self._GetKeywordMetadata()['keywords'][name]['lineno']}"
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
     @keyword
-    def pretty_print(self, oData=None, sPrefix=None):
+    def pretty_print(self, oData=None, sPrefix=None, bBlockMode=False, sSink="both", nMaxDepth=None, nMaxItems=None, nMaxLines=None, nHead=None, nTail=None, nSample=None, nSeed=0, bShareSubtrees=False, sFile=None, sFileFormat="text", bGzip=False, sFormat="text", bSkipUnchanged=False, sLabel=None, fTimeout=None, nMaxBytes=None, bFailOnBudget=False, nProcesses=None, nParallelThreshold=100000):
        """
 The ``pretty_print`` keyword logs the content of parameters of any Python data type (input: ``oData``).
 
@@ -113,6 +540,170 @@ The output is also returned as list of strings.
 
   If not ``None``, this prefix string is added to every output line.
 
+* ``bBlockMode``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the complete output is written as one single log message and with one single console write
+  (instead of one log message and one console write per line). Recommended for large data structures,
+  because this keeps the size of the ``output.xml`` small and speeds up the console output.
+
+* ``sSink``
+
+  / *Condition*: optional / *Type*: str / *Default*: "both" /
+
+  Destination of the output: ``log`` (log file only), ``console`` (console only), ``both`` (log file and console),
+  ``none`` (no output; the lines are only returned) or ``file`` (separate output file, see ``sFile``).
+
+* ``sFile``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Output file (``sSink=file`` only). Relative paths are relative to the output directory. Default: a new file within the
+  subfolder ``pretty_print`` of the output directory. The lines are written incrementally; the memory consumption does not
+  depend on the size of ``oData``. Only a summary with a link to the file is written to the log file.
+
+* ``sFileFormat``
+
+  / *Condition*: optional / *Type*: str / *Default*: "text" /
+
+  Format of the output file: ``text`` (one line of output per line) or ``jsonl`` (one JSON object ``{"line" : ...}`` per line).
+  Relevant for ``sFormat=text`` only (the lines of the other formats already are JSON objects).
+
+* ``bGzip``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the output file is gzip compressed (extension ``.gz``).
+
+* ``nMaxDepth``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of nested container levels to be resolved. Containers below this level are not resolved;
+  only the number of their elements is printed. ``None`` means no limit.
+
+* ``nMaxItems``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of elements to be printed per container (list, tuple, set, dictionary). The remaining elements
+  are summarized in one line (e.g. ``[LIST] ... 499,000 more items``). ``None`` means no limit.
+
+* ``nMaxLines``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum number of lines to be printed. The output is truncated after this number of lines. ``None`` means no limit.
+
+* ``nHead``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Sampling mode: number of elements to be printed at the beginning of every container.
+
+* ``nTail``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Sampling mode: number of elements to be printed at the end of every container.
+
+* ``nSample``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Sampling mode: number of randomly selected elements to be printed out of the elements between head and tail of every container.
+
+* ``nSeed``
+
+  / *Condition*: optional / *Type*: int / *Default*: 0 /
+
+  Sampling mode: seed of the random selection (the same seed prints the same elements of the same data).
+
+If at least one of ``nHead``, ``nTail`` and ``nSample`` is given, only the selected elements of every container are printed.
+They keep their original counter numbers; the elements in between are summarized (e.g. ``[LIST] ... 499,000 more items``).
+Containers with not more elements than selected are printed completely.
+
+* ``bShareSubtrees``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, a container that is referenced several times within ``oData``, is printed only once (at the first reference).
+  All further references are printed as one line pointing to the first one (``<shared: already printed at ...>``).
+  With this option the output size depends on the number of unique containers within ``oData``.
+
+Containers that contain themselves (directly or indirectly) are printed as back-reference (``<cycle: back-reference to ...>``).
+
+* ``sFormat``
+
+  / *Condition*: optional / *Type*: str / *Default*: "text" /
+
+  Format of the output:
+
+  - ``text``: pretty print lines
+  - ``jsonl``: one JSON object per line with the keys ``path`` (list of the keys and indices from the top level down to
+    the element), ``type``, ``count`` (number of elements of the surrounding container), ``index`` (index of the element
+    within the surrounding container) and ``value``. Lines without element (e.g. ``... 10 more items``) contain ``note``
+    instead of ``value``. ``sPrefix`` is not considered.
+  - ``dict``: same output like ``jsonl``, but the keyword returns a nested dictionary: every container is a dictionary
+    with the keys (dictionaries) or indices (all other containers) of its elements as keys, e.g. ``${dResult}[kList][${0}]``.
+
+* ``bSkipUnchanged``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the fingerprint of ``oData`` (see keyword ``fingerprint``) is compared with the fingerprint of the last output
+  with the same label (``sLabel``). In case of the content (and all other parameters influencing the output) is unchanged,
+  only one line ``<unchanged since last print>`` is written instead of the complete data structure. Use case: polling
+  the same status object within a loop. Not relevant for ``sFormat=dict``. An output truncated because of a budget
+  (``fTimeout``, ``nMaxBytes``) is not remembered: the same data is printed again with the next call.
+
+* ``sLabel``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Label identifying the data printed with ``bSkipUnchanged``. Default: ``sPrefix``.
+
+* ``fTimeout``
+
+  / *Condition*: optional / *Type*: float / *Default*: None /
+
+  Time budget in seconds (wall clock time of rendering and output). Default: library parameter ``fTimeout`` (no limit).
+
+* ``nMaxBytes``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Maximum size of the output in characters. Default: library parameter ``nMaxBytes`` (no limit).
+
+* ``bFailOnBudget``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the keyword fails in case of a budget is exceeded.
+
+In case of a budget is exceeded, the rendering stops and the output computed so far is written - followed by a line
+``... output truncated after ... lines (...)``. The keyword does not fail (except with ``bFailOnBudget``).
+
+* ``nProcesses``
+
+  / *Condition*: optional / *Type*: int / *Default*: None /
+
+  Parallel mode: number of processes rendering chunks of the top level container. The output is the same as in serial mode.
+  ``None`` means serial mode.
+
+* ``nParallelThreshold``
+
+  / *Condition*: optional / *Type*: int / *Default*: 100000 /
+
+  Parallel mode: minimum number of elements of the top level container. Smaller containers are rendered serially.
+
+The parallel mode requires ``fork`` (not available under Windows). Serial mode is used also in case of the output format is not
+``text``, or a limit, a budget, the sampling mode or ``bShareSubtrees`` is used.
+
+The data structure is traversed only as far as required by the limits and samples. Therefore the computation time of
+this keyword depends on the size of the output - and not on the size of ``oData``.
+
 **Returns:**
 
 * ``listOutLines`` (*list*)
@@ -120,34 +711,224 @@ The output is also returned as list of strings.
   / *Type*: list /
 
   List of strings containing the resolved data structure of ``oData`` (same content as printed to console).
+
+  In case of ``sSink`` is ``file``, the path and name of the output file is returned instead.
+
+  In case of ``sFormat`` is ``dict``, the nested dictionary is returned (for all sinks).
+
+  In case of ``bSkipUnchanged`` is ``True`` and ``oData`` is unchanged, a list with the ``unchanged`` line only is returned.
        """
 
        # BuiltIn().log(f"This is {self.sThisModule}", "INFO") # debug
 
-       oTypePrint   = CTypePrint()
-       listOutLines = oTypePrint.TypePrint(oData)
-
-       if sPrefix is None:
-          for sLine in listOutLines:
-             BuiltIn().log(sLine, "INFO")
-             BuiltIn().log_to_console(sLine)
-          return listOutLines
+       sSink = str(sSink).lower()
+       if sSink not in listOutputSinks + ["file"]:
+          raise ValueError(f"Invalid output sink '{sSink}'. Expected one of: {', '.join(listOutputSinks + ['file'])}")
+       sFileFormat = str(sFileFormat).lower()
+       if sFileFormat not in listFileFormats:
+          raise ValueError(f"Invalid file format '{sFileFormat}'. Expected one of: {', '.join(listFileFormats)}")
+       sFormat = str(sFormat).lower()
+       if sFormat not in listOutputFormats:
+          raise ValueError(f"Invalid output format '{sFormat}'. Expected one of: {', '.join(listOutputFormats)}")
+
+       fTimeout  = self.fTimeout if fTimeout is None else self._GetBudget(fTimeout, "fTimeout")
+       nMaxBytes = self.nMaxBytes if nMaxBytes is None else self._GetLimit(nMaxBytes, "nMaxBytes")
+
+       bSkipUnchanged = (bSkipUnchanged is True) and (sFormat != "dict")
+       if bSkipUnchanged is True:
+          listOutLines = self._SkipUnchanged(oData, sPrefix, sLabel, sSink, bBlockMode,
+                                             (nMaxDepth, nMaxItems, nMaxLines, nHead, nTail, nSample, nSeed, bShareSubtrees, sFormat,
+                                              sPrefix, sSink, sFile, sFileFormat, bGzip, bBlockMode, fTimeout, nMaxBytes))
+          if listOutLines is not None:
+             return listOutLines
+
+       from RobotframeworkExtensions.CTypeRenderer import CTypeRenderer, GetNestedDict
+       oTypeRenderer = CTypeRenderer(nMaxDepth=self._GetLimit(nMaxDepth, "nMaxDepth"),
+                                     nMaxItems=self._GetLimit(nMaxItems, "nMaxItems"),
+                                     nMaxLines=self._GetLimit(nMaxLines, "nMaxLines"),
+                                     nHead=self._GetLimit(nHead, "nHead"),
+                                     nTail=self._GetLimit(nTail, "nTail"),
+                                     nSample=self._GetLimit(nSample, "nSample"),
+                                     nSeed=int(nSeed),
+                                     bShareSubtrees=bShareSubtrees,
+                                     fTimeout=fTimeout,
+                                     nMaxBytes=nMaxBytes)
+
+       if sFormat == "dict":
+          listRecords = list(oTypeRenderer.RenderRecords(oData))
+          if sSink != "none":
+             oLines = (json.dumps(dictRecord, ensure_ascii=False, default=str) for dictRecord in listRecords)
+             if sSink == "file":
+                self._EmitLinesToFile(oLines, sFile, "records", bGzip)
+             else:
+                self._EmitLines(oLines, bBlockMode, sSink)
+          self._CheckBudget(oTypeRenderer, bFailOnBudget)
+          return GetNestedDict(listRecords)
+
+       if sFormat == "jsonl":
+          oLines = (json.dumps(dictRecord, ensure_ascii=False, default=str) for dictRecord in oTypeRenderer.RenderRecords(oData))
+          sFileFormat = "records" # the lines already are JSON objects
+       else:
+          if nProcesses is not None:
+             oLines = oTypeRenderer.RenderParallel(oData, self._GetLimit(nProcesses, "nProcesses"), self._GetLimit(nParallelThreshold, "nParallelThreshold"))
+          else:
+             oLines = oTypeRenderer.Render(oData)
+          if sPrefix is not None:
+             oLines = (f"{sPrefix} : {sLine}" for sLine in oLines)
+
+       if sSink == "file":
+          oResult = self._EmitLinesToFile(oLines, sFile, sFileFormat, bGzip)
        else:
-          listOutLinesNew = []
-          for sLine in listOutLines:
-             sLine = f"{sPrefix} : {sLine}"
-             BuiltIn().log(sLine, "INFO")
-             BuiltIn().log_to_console(sLine)
-             listOutLinesNew.append(sLine)
-          return listOutLinesNew
+          oResult = self._EmitLines(oLines, bBlockMode, sSink)
+
+       if (bSkipUnchanged is True) and (oTypeRenderer.sTruncated not in (None, "max lines reached")):
+          # output truncated because of a budget: the next output of this data is not 'unchanged'
+          self.dictLastPrinted.pop(sPrefix if sLabel is None else sLabel, None)
+       self._CheckBudget(oTypeRenderer, bFailOnBudget)
+       return oResult
 
-    # eof def pretty_print(self, oData=None, sPrefix=None):
+    # eof def pretty_print(self, oData=None, sPrefix=None, bBlockMode=False, sSink="both", nMaxDepth=None, nMaxItems=None, nMaxLines=None, nHead=None, nTail=None, nSample=None, nSeed=0, bShareSubtrees=False, sFile=None, sFileFormat="text", bGzip=False, sFormat="text", bSkipUnchanged=False, sLabel=None, fTimeout=None, nMaxBytes=None, bFailOnBudget=False, nProcesses=None, nParallelThreshold=100000):
 
     # --------------------------------------------------------------------------------------------------------------
     #TM***
 
     @keyword
-    def normalize_path(self, sPath=None, bWin=False, sReferencePathAbs=None, bConsiderBlanks=False, bExpandEnvVars=True, bMask=True):
+    def pretty_diff(self, oData1=None, oData2=None, sPrefix=None, bBlockMode=False, sSink="both"):
+       """
+The ``pretty_diff`` keyword compares two parameters of any Python data type (input: ``oData1`` and ``oData2``) and logs
+the differences in the same format as ``pretty_print`` is using.
+
+Only the paths to the differing elements are printed. Lines with content of ``oData1`` start with ``-``, lines with
+content of ``oData2`` start with ``+``. Elements of dictionaries are compared by their keys, elements of lists and tuples
+by their position and elements of sets by their content. Elements with different types are different (also in case of
+their values are equal, like ``1`` and ``1.0``).
+
+Internally structural hashes of all containers of both parameters are computed. Containers with equal hashes are skipped
+without any further comparison and without any rendering. Therefore the computation time depends on the size of the
+parameters and on the number of differences - but not on the size of the rendering of the parameters.
+
+**Arguments:**
+
+* ``oData1``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  First data to be compared
+
+* ``oData2``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  Second data to be compared
+
+* ``sPrefix``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  If not ``None``, this prefix string is added to every output line.
+
+* ``bBlockMode``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, the complete output is written as one single log message and with one single console write.
+
+* ``sSink``
+
+  / *Condition*: optional / *Type*: str / *Default*: "both" /
+
+  Destination of the output: ``log``, ``console``, ``both`` or ``none`` (see ``pretty_print``).
+
+**Returns:**
+
+* ``listOutLines`` (*list*)
+
+  / *Type*: list /
+
+  List of strings containing the differences between ``oData1`` and ``oData2`` (empty list in case of both parameters are equal).
+       """
+       sSink = str(sSink).lower()
+       if sSink not in listOutputSinks:
+          raise ValueError(f"Invalid output sink '{sSink}'. Expected one of: {', '.join(listOutputSinks)}")
+
+       from RobotframeworkExtensions.CTypeDiff import CTypeDiff
+       oTypeDiff = CTypeDiff()
+       oLines    = oTypeDiff.Diff(oData1, oData2)
+
+       if sPrefix is not None:
+          oLines = (f"{sPrefix} : {sLine}" for sLine in oLines)
+
+       listOutLines = self._EmitLines(oLines, bBlockMode, sSink)
+
+       return listOutLines
+
+    # eof def pretty_diff(self, oData1=None, oData2=None, sPrefix=None, bBlockMode=False, sSink="both"):
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def fingerprint(self, oData=None):
+       """
+The ``fingerprint`` keyword computes a hash of the content of parameters of any Python data type (input: ``oData``).
+
+The hash is based on the same type resolution as ``pretty_print`` is using: two parameters have the same fingerprint,
+if their ``pretty_print`` output is the same. The order of the elements of lists, tuples and dictionaries is considered;
+the order of the elements of sets is not considered.
+
+The hash is computed directly out of the data structure (the ``pretty_print`` output is not computed). Nevertheless
+the first fingerprint of a data structure takes about the same time as hashing its ``pretty_print`` output.
+
+The hashes of immutable parts of the data structure (tuples consisting of immutable objects only, long strings) are cached;
+therefore repeated fingerprints of a data structure with unchanged immutable parts are faster. The gain only applies
+to these immutable parts: the hashes of mutable containers (lists, dictionaries, sets) and of everything within them,
+that is not immutable, are computed again with every call. For usual data of tests (nested dictionaries and lists of
+numbers and short strings) repeated fingerprints are not faster.
+
+Use case: check that a large data structure did not change between two steps of a test.
+
+**Arguments:**
+
+* ``oData``
+
+  / *Condition*: required / *Type*: any Python type /
+
+  Data to compute the fingerprint for
+
+**Returns:**
+
+* ``sFingerprint``
+
+  / *Type*: str /
+
+  The fingerprint (hexadecimal string with 32 characters)
+       """
+       try:
+          bDigest = self._GetTypeHash().Hash(oData)
+       finally:
+          self.oTypeHash.Clear() # mutable containers may change until the next call
+       return bDigest.hex()
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def flush_console(self):
+       """
+The ``flush_console`` keyword waits until the complete console output of previous keywords is written.
+
+This is only relevant in case of the library is imported with ``bAsyncConsole=True`` (otherwise the console output
+is written synchronously and this keyword does nothing). At the end of every test and every suite the console output
+is flushed automatically.
+       """
+       if self.oConsoleWriter is not None:
+          self.oConsoleWriter.Flush()
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def normalize_path(self, sPath=None, bWin=False, sReferencePathAbs=None, bConsiderBlanks=False, bExpandEnvVars=True, bMask=True, sEngine=None):
        """
 The ``normalize_path`` keyword normalizes local paths, paths to local network resources and internet addresses
 
@@ -195,6 +976,13 @@ The ``normalize_path`` keyword normalizes local paths, paths to local network re
 
   In case of ``bWin`` is ``False`` ``bMask`` has no effect.
 
+* ``sEngine``
+
+  / *Condition*: optional / *Type*: str / *Default*: None /
+
+  Path normalization engine: ``native`` (implementation of this library; faster) or ``cstring`` (``CString.NormalizePath``
+  of the PythonExtensionsCollection). Both engines compute the same results. Default: library parameter ``sPathEngine``.
+
 **Returns:**
 
 * ``sPath``
@@ -203,10 +991,277 @@ The ``normalize_path`` keyword normalizes local paths, paths to local network re
 
   The normalized path (is ``None`` in case of ``sPath`` is ``None``)
        """
-       sPath = CString.NormalizePath(sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask)
+       sEngine = self.sPathEngine if sEngine is None else str(sEngine).lower()
+       sPath = self.oPathCache.NormalizePath(sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask, sEngine)
        return sPath
 
     # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def normalize_paths(self, oPaths=None, bWin=False, sReferencePathAbs=None, bConsiderBlanks=False, bExpandEnvVars=True, bMask=True, bUnique=False, sEngine=None):
+       """
+The ``normalize_paths`` keyword normalizes all paths of a list or of a dictionary with one single keyword call
+(instead of a loop calling ``normalize_path``). Every path is normalized in the same way like ``normalize_path`` is doing.
+
+**Arguments:**
+
+* ``oPaths``
+
+  / *Condition*: required / *Type*: list, dict /
+
+  List of paths or dictionary with paths as values (e.g. name -> path)
+
+* ``bWin``, ``sReferencePathAbs``, ``bConsiderBlanks``, ``bExpandEnvVars``, ``bMask``, ``sEngine``
+
+  / *Condition*: optional / *Type*: bool, str / *Default*: see ``normalize_path`` /
+
+  Same meaning as in keyword ``normalize_path`` (valid for all paths)
+
+* ``bUnique``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, duplicate normalized paths are removed (the first occurrence is kept; in case of dictionaries
+  the entries with duplicate normalized paths are removed).
+
+**Returns:**
+
+* ``oNormalizedPaths``
+
+  / *Type*: list, dict /
+
+  List or dictionary (same shape as ``oPaths``) with the normalized paths. Paths that are equal before normalization
+  are normalized only once.
+       """
+       dictNormalizedPaths = {} # path -> normalized path (within this call)
+       sEngine = self.sPathEngine if sEngine is None else str(sEngine).lower()
+
+       def NormalizePath(sPath):
+          if sPath not in dictNormalizedPaths:
+             dictNormalizedPaths[sPath] = self.oPathCache.NormalizePath(sPath, bWin, sReferencePathAbs, bConsiderBlanks, bExpandEnvVars, bMask, sEngine)
+          return dictNormalizedPaths[sPath]
+
+       if isinstance(oPaths, dict):
+          dictResult = {}
+          setFound   = set()
+          for oKey, sPath in oPaths.items():
+             sNormalizedPath = NormalizePath(sPath)
+             if bUnique is True:
+                if sNormalizedPath in setFound:
+                   continue
+                setFound.add(sNormalizedPath)
+             dictResult[oKey] = sNormalizedPath
+          return dictResult
+
+       if isinstance(oPaths, str):
+          raise ValueError("Invalid type of parameter 'oPaths': str. Expected a list or a dictionary of paths (single paths: keyword 'normalize_path')")
+       listResult = [NormalizePath(sPath) for sPath in oPaths]
+       if bUnique is True:
+          listResult = list(dict.fromkeys(listResult))
+       return listResult
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def register_reference_paths(self, *oReferencePaths):
+       """
+The ``register_reference_paths`` keyword registers reference paths (e.g. the suite directory), that are used as ``sReferencePathAbs``
+in following calls of ``normalize_path`` and ``normalize_paths``.
+
+Every reference path is normalized once. Relative paths are normalized on their own and joined with the pre-normalized reference path
+(leading ``..`` remove parts of the reference path) - without normalizing the reference path again in every call. Reference paths that
+are not registered, are registered automatically with their first usage. This keyword is intended to be called in a suite setup.
+
+Applies to the ``native`` path normalization engine.
+
+**Arguments:**
+
+* ``oReferencePaths``
+
+  / *Condition*: required / *Type*: str, list /
+
+  One or more reference paths (expected to be absolute), also as lists
+
+**Returns:**
+
+* ``listReferencePaths``
+
+  / *Type*: list /
+
+  The normalized reference paths
+       """
+       listReferencePaths = []
+       for oReferencePath in oReferencePaths:
+          listReferencePaths.extend([oReferencePath] if isinstance(oReferencePath, str) else oReferencePath)
+       for sReferencePath in listReferencePaths:
+          self.oPathCache.RegisterReferencePath(sReferencePath)
+       return [self.oPathCache.NormalizePath(sReferencePath, sEngine=self.sPathEngine) for sReferencePath in listReferencePaths]
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def normalize_path_statistics(self):
+       """
+The ``normalize_path_statistics`` keyword returns the statistics of the cache of the keyword ``normalize_path``.
+
+The results of ``normalize_path`` are cached (library parameter ``nPathCacheSize``). In case of environment variables
+are expanded, a cached result is used only as long as the values of the environment variables referenced within the path
+are unchanged (otherwise the path is normalized again: invalidation).
+
+**Returns:**
+
+* ``dStatistics``
+
+  / *Type*: dict /
+
+  ``hits``, ``misses`` and ``invalidations`` of the cache, number of cached paths (``entries``), size of the cache (``size``)
+  number of pre-normalized reference paths (``references``, see ``register_reference_paths``) and number of paths loaded
+  from the shared state (``shared``, see library parameter ``sSharedState``) and number of paths taken from these ones (``shared_hits``).
+       """
+       return self.oPathCache.GetStatistics()
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def index_tree(self, sPath=None, oIncludes=None, oExcludes=None, bFiles=True, bDirectories=False, bFollowLinks=False):
+       """
+The ``index_tree`` keyword walks the directory tree below ``sPath`` and builds an index of all files (and optionally directories).
+
+The index contains the relative paths of all entries - normalized (slashes as separators), sorted and deduplicated.
+The tree is walked by ``os.scandir`` (iteratively, entry by entry); only the paths themselves are kept in memory.
+The index can be queried (keyword ``query_tree_index``) and compared (keyword ``diff_tree_index``).
+
+**Arguments:**
+
+* ``sPath``
+
+  / *Condition*: required / *Type*: str /
+
+  Path of the root folder (normalized in the same way like ``normalize_path`` is doing)
+
+* ``oIncludes``
+
+  / *Condition*: optional / *Type*: str, list / *Default*: None /
+
+  Glob pattern(s) relative to the root folder (e.g. ``*.log``, ``logs/*.txt``). Only entries matching at least one
+  of these patterns are part of the index. ``*`` also matches path separators. ``None``: all entries.
+
+* ``oExcludes``
+
+  / *Condition*: optional / *Type*: str, list / *Default*: None /
+
+  Glob pattern(s) relative to the root folder. Entries matching at least one of these patterns are not part of the index;
+  directories matching at least one of these patterns are not walked.
+
+* ``bFiles``, ``bDirectories``
+
+  / *Condition*: optional / *Type*: bool / *Default*: True, False /
+
+  Types of entries that are part of the index
+
+* ``bFollowLinks``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, symbolic links to directories are walked (every directory only once, also in case of link cycles).
+
+**Returns:**
+
+* ``oTreeIndex``
+
+  / *Type*: CTreeIndex /
+
+  The index (to be passed to ``query_tree_index`` and ``diff_tree_index``; ``len`` is the number of entries)
+       """
+       sRootPath = self.oPathCache.NormalizePath(sPath, sEngine=self.sPathEngine)
+       if os.path.isdir(sRootPath) is False:
+          raise ValueError(f"The folder '{sRootPath}' does not exist")
+       from RobotframeworkExtensions.CTreeIndex import CTreeIndex
+       return CTreeIndex(sRootPath, oIncludes, oExcludes, bFiles, bDirectories, bFollowLinks)
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def query_tree_index(self, oTreeIndex=None, sPattern="*", bAbsolute=False):
+       """
+The ``query_tree_index`` keyword returns all paths of an index (see keyword ``index_tree``), that match a glob pattern.
+
+**Arguments:**
+
+* ``oTreeIndex``
+
+  / *Condition*: required / *Type*: CTreeIndex /
+
+  The index returned by ``index_tree``
+
+* ``sPattern``
+
+  / *Condition*: optional / *Type*: str / *Default*: "*" /
+
+  Glob pattern relative to the root folder (``*`` also matches path separators). Patterns without wildcards
+  are looked up directly (e.g. to check if a certain file exists).
+
+* ``bAbsolute``
+
+  / *Condition*: optional / *Type*: bool / *Default*: False /
+
+  If ``True``, absolute paths are returned (root folder + relative path), otherwise relative paths.
+
+**Returns:**
+
+* ``listPaths``
+
+  / *Type*: list /
+
+  Sorted list of all matching paths
+       """
+       listPaths = oTreeIndex.Query(sPattern)
+       if bAbsolute is True:
+          sRootPath = oTreeIndex.sRootPath.rstrip("/")
+          listPaths = [f"{sRootPath}/{sPath}" for sPath in listPaths]
+       return listPaths
+
+    # --------------------------------------------------------------------------------------------------------------
+    #TM***
+
+    @keyword
+    def diff_tree_index(self, oTreeIndex=None, oExpected=None):
+       """
+The ``diff_tree_index`` keyword compares an index (see keyword ``index_tree``) with another index or with a list of
+expected relative paths (e.g. a manifest).
+
+**Arguments:**
+
+* ``oTreeIndex``
+
+  / *Condition*: required / *Type*: CTreeIndex /
+
+  The index returned by ``index_tree``
+
+* ``oExpected``
+
+  / *Condition*: required / *Type*: CTreeIndex, list /
+
+  Another index or a list of relative paths (normalized before the comparison)
+
+**Returns:**
+
+* ``dDiff``
+
+  / *Type*: dict /
+
+  ``missing``: sorted list of the expected paths, that are not part of ``oTreeIndex``;
+  ``unexpected``: sorted list of the paths of ``oTreeIndex``, that are not expected. Both lists are empty in case of no differences.
+       """
+       listMissing, listUnexpected = oTreeIndex.Diff(oExpected)
+       return {"missing" : listMissing, "unexpected" : listUnexpected}
+
+    # --------------------------------------------------------------------------------------------------------------
 
 # eof class Collection(object):
 
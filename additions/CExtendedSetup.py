@@ -95,6 +95,29 @@ class CExtendedSetup():
 
     # --------------------------------------------------------------------------------------------------------------
 
+    def genkeywordmetadata(self):
+        """Computes the keyword metadata of the library (shipped as package data; see RobotframeworkExtensions.CKeywordMetadata)
+        """
+        sPython = self.__oRepositoryConfig.Get('PYTHON')
+        sReferencePath = self.__oRepositoryConfig.Get('REFERENCEPATH')
+        listCmdLineParts = [sPython, "-m", f"{self.__oRepositoryConfig.Get('PACKAGENAME')}.CKeywordMetadata"]
+        print()
+        print("Now executing command line:\n" + " ".join(listCmdLineParts))
+        print()
+        nReturn = ERROR
+        try:
+            nReturn = subprocess.call(listCmdLineParts, cwd=sReferencePath)
+        except Exception as ex:
+            print()
+            printexception(str(ex))
+            print()
+            return ERROR
+        print()
+        return nReturn
+    # eof def genkeywordmetadata():
+
+    # --------------------------------------------------------------------------------------------------------------
+
     def convert_repo_readme(self):
         """Converts the main repository README from 'rst' to 'md' format.
         """
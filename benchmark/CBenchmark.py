@@ -0,0 +1,163 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# CBenchmark.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Helper for the benchmark scripts of this repository:
+# - execution of generated robot test suites (with the RobotframeworkExtensions of this repository)
+# - time measurement of Python code
+# - printing of result tables
+#
+# The benchmark scripts are repository internal helper and not part of the distribution.
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import os, sys, io, time
+
+# prefer the repository local version of the RobotframeworkExtensions (instead of the installed version under site-packages)
+sRepositoryPath = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if sRepositoryPath not in sys.path:
+   sys.path.insert(0, sRepositoryPath)
+
+import robot
+from robot.api import ExecutionResult
+
+# --------------------------------------------------------------------------------------------------------------
+#
+# robot suite header used by all generated benchmark suites
+#
+sSuiteHeader = """*** Settings ***
+Library    RobotframeworkExtensions.Collection    WITH NAME    rf.extensions
+
+"""
+
+# --------------------------------------------------------------------------------------------------------------
+#TM***
+
+class CBenchmark(object):
+   """
+The class ``CBenchmark`` provides methods to execute and to measure benchmarks.
+   """
+
+   def __init__(self, sOutputPath=None):
+      if sOutputPath is None:
+         sOutputPath = os.path.join(os.path.dirname(os.path.abspath(__file__)), "logfiles")
+      self.sOutputPath = sOutputPath
+      os.makedirs(self.sOutputPath, exist_ok=True)
+
+   def __del__(self):
+      pass
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def RunRobotSuite(self, sName=None, sSuiteContent=None, dVariables=None, listListeners=None):
+      """
+Writes the robot suite ``sSuiteContent`` (without settings section) to a file, executes it and returns
+a dictionary with the measured values:
+
+* ``fTime``: wall clock time of the robot execution in seconds
+* ``nOutputSize``: size of the output.xml in bytes
+* ``dKeywordTimes``: elapsed time (in seconds) per keyword name, summed up over all tests
+* ``nFailed``: number of failed tests
+      """
+      sSuiteFile  = os.path.join(self.sOutputPath, f"{sName}.robot")
+      sOutputFile = os.path.join(self.sOutputPath, f"{sName}.xml")
+      with open(sSuiteFile, "w", encoding="utf-8") as oSuiteFile:
+         oSuiteFile.write(sSuiteHeader + sSuiteContent)
+
+      listVariables = []
+      if dVariables is not None:
+         listVariables = [f"{sKey}:{sValue}" for sKey, sValue in dVariables.items()]
+
+      oStdout = io.StringIO()
+      fStart = time.perf_counter()
+      robot.run(sSuiteFile,
+                outputdir=self.sOutputPath,
+                output=sOutputFile,
+                log="NONE",
+                report="NONE",
+                variable=listVariables,
+                listener=listListeners or [],
+                pythonpath=[sRepositoryPath],
+                console="none",
+                stdout=oStdout,
+                stderr=oStdout)
+      fTime = time.perf_counter() - fStart
+
+      oResult = ExecutionResult(sOutputFile)
+      dKeywordTimes = {}
+      for oTest in oResult.suite.all_tests:
+         for oKeyword in oTest.body:
+            if getattr(oKeyword, "type", None) != "KEYWORD":
+               continue # control structures (FOR, IF, ...)
+            sKeywordName = oKeyword.name
+            fElapsed = oKeyword.elapsed_time.total_seconds() if hasattr(oKeyword, "elapsed_time") else oKeyword.elapsedtime / 1000.0
+            dKeywordTimes[sKeywordName] = dKeywordTimes.get(sKeywordName, 0.0) + fElapsed
+
+      dResult = {"fTime"         : fTime,
+                 "nOutputSize"   : os.path.getsize(sOutputFile),
+                 "dKeywordTimes" : dKeywordTimes,
+                 "nFailed"       : oResult.statistics.total.failed}
+      return dResult
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def Measure(self, oFunction=None, nRepeat=5):
+      """
+Calls ``oFunction`` (without arguments) ``nRepeat`` times and returns the best time (in seconds) of all calls and the result of the last call.
+      """
+      fBest   = None
+      oResult = None
+      for _ in range(nRepeat):
+         fStart  = time.perf_counter()
+         oResult = oFunction()
+         fTime   = time.perf_counter() - fStart
+         if (fBest is None) or (fTime < fBest):
+            fBest = fTime
+      return fBest, oResult
+
+   # --------------------------------------------------------------------------------------------------------------
+   #TM***
+
+   def PrintTable(self, listHeader=None, listRows=None):
+      """
+Prints ``listRows`` (list of lists) as table with the column names ``listHeader``.
+      """
+      listRows   = [[str(oCell) for oCell in listRow] for listRow in listRows]
+      listWidths = [len(sHeader) for sHeader in listHeader]
+      for listRow in listRows:
+         for nIndex, sCell in enumerate(listRow):
+            listWidths[nIndex] = max(listWidths[nIndex], len(sCell))
+      print()
+      print(" | ".join(sHeader.ljust(listWidths[nIndex]) for nIndex, sHeader in enumerate(listHeader)))
+      print("-+-".join("-" * nWidth for nWidth in listWidths))
+      for listRow in listRows:
+         print(" | ".join(sCell.ljust(listWidths[nIndex]) for nIndex, sCell in enumerate(listRow)))
+      print()
+
+# eof class CBenchmark(object):
+
+# --------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,84 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_fingerprint.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the computation time of the 'fingerprint' keyword (structural hash, with and without cache)
+# with hashing the 'pretty_print' output of the same data.
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, hashlib
+
+from CBenchmark import CBenchmark
+
+from RobotframeworkExtensions.CTypeRenderer import CTypeRenderer
+from RobotframeworkExtensions.CTypeHash import CTypeHash
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--elements', type=int, default=20000, help='Number of measurement records (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nElements = oCmdLineArgs.elements
+
+# measurement records (immutable tuples) within a mutable status dictionary: the hashes of the records are cached
+dData = {"status"  : {"state" : "running", "counter" : 17},
+         "records" : [(nIndex, f"channel_{nIndex % 16}", nIndex * 0.5, (nIndex % 2 == 0, None)) for nIndex in range(nElements)],
+         "trace"   : "x" * 1000000}
+
+# the same measurement records as mutable lists (usual data of tests): nothing is cached
+dMutableData = {"status"  : dData["status"],
+                "records" : [[nIndex, sChannel, fValue, [bEven, oNone]] for nIndex, sChannel, fValue, (bEven, oNone) in dData["records"]],
+                "trace"   : "x" * 1000000}
+
+def HashPrettyPrint(oData):
+   oHash = hashlib.sha256()
+   for sLine in CTypeRenderer().Render(oData):
+      oHash.update(sLine.encode("utf-8"))
+      oHash.update(b"\n")
+   return oHash.hexdigest()
+
+def Fingerprint(oTypeHash, oData):
+   try:
+      return oTypeHash.Hash(oData).hex()
+   finally:
+      oTypeHash.Clear()
+
+oBenchmark = CBenchmark()
+listRows   = []
+for sData, oData in (("immutable records", dData), ("mutable records", dMutableData)):
+   fTimeText, _ = oBenchmark.Measure(lambda: HashPrettyPrint(oData), nRepeat=3)
+   fTimeCold, _ = oBenchmark.Measure(lambda: Fingerprint(CTypeHash(nCacheSize=0), oData), nRepeat=3)
+   oTypeHash    = CTypeHash(nCacheSize=2 * nElements)
+   Fingerprint(oTypeHash, oData) # fill the cache
+   fTimeWarm, _ = oBenchmark.Measure(lambda: Fingerprint(oTypeHash, oData), nRepeat=3)
+   listRows.extend([[sData, "hash of pretty_print output", f"{fTimeText:.4f}", "1.0x"],
+                    [sData, "fingerprint (no cache)", f"{fTimeCold:.4f}", f"{fTimeText / fTimeCold:.1f}x"],
+                    [sData, "fingerprint (warm cache)", f"{fTimeWarm:.4f}", f"{fTimeText / fTimeWarm:.1f}x"]])
+
+print(f"Fingerprint of a dictionary with {nElements} records (tuples or lists) and a string with 1,000,000 characters")
+print("(the cache only applies to immutable parts of the data: tuples of immutable objects, long strings)")
+oBenchmark.PrintTable(["data", "method", "time [s]", "speedup"], listRows)
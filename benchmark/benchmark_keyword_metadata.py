@@ -0,0 +1,96 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#
+#
+# benchmark_keyword_metadata.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, os, subprocess, sys
+
+from CBenchmark import CBenchmark, sRepositoryPath
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--repeat', type=int, default=10, help='Number of measurements per variant; the best one is taken (optional).')
+oCmdLineParser.add_argument('--calls', type=int, default=100000, help='Number of calls per keyword call latency measurement (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+# measured in a new process every time (the metadata is loaded once per process)
+sMeasurement = """
+import time
+from robot.running import TestLibrary
+from robot.libdocpkg import LibraryDocumentation
+from RobotframeworkExtensions import Collection
+if {bIntrospection}:
+   Collection.METADATA_FILE = "not_existing.json"
+fStart = time.perf_counter()
+if "{sOperation}" == "load":
+   TestLibrary.from_name("RobotframeworkExtensions.Collection", create_keywords=True)
+else:
+   LibraryDocumentation("RobotframeworkExtensions.Collection").to_dictionary()
+print(time.perf_counter() - fStart)
+"""
+
+oBenchmark = CBenchmark()
+sMetadataFile = os.path.join(sRepositoryPath, "RobotframeworkExtensions", "Collection.keywords.json")
+if not os.path.isfile(sMetadataFile):
+   subprocess.run([sys.executable, "-m", "RobotframeworkExtensions.CKeywordMetadata"], cwd=sRepositoryPath, check=True)
+dictEnv = dict(os.environ, PYTHONPATH=os.pathsep.join([sRepositoryPath, os.environ.get("PYTHONPATH", "")]))
+
+def Measure(sOperation=None, bIntrospection=False):
+   """
+Returns the best time (seconds) of loading the library (``load``) or of computing the libdoc data (``libdoc``) within a new process.
+   """
+   listTimes = []
+   for _ in range(oCmdLineArgs.repeat):
+      oProcess = subprocess.run([sys.executable, "-c", sMeasurement.format(sOperation=sOperation, bIntrospection=bIntrospection)],
+                                env=dictEnv, capture_output=True, text=True, check=True)
+      listTimes.append(float(oProcess.stdout))
+   return min(listTimes)
+
+listRows      = []
+listReference = None
+for sVariant, bIntrospection in (("introspection", True), ("precomputed metadata", False)):
+   fLoad   = Measure("load", bIntrospection)
+   fLibdoc = Measure("libdoc", bIntrospection)
+   if listReference is None:
+      listReference = [fLoad, fLibdoc]
+   listRows.append([sVariant, f"{fLoad * 1000:.2f}", f"{listReference[0] / fLoad:.1f}x", f"{fLibdoc * 1000:.2f}", f"{listReference[1] / fLibdoc:.1f}x"])
+
+oBenchmark.PrintTable(["variant", "library loading [ms]", "speedup", "libdoc [ms]", "speedup"], listRows)
+
+# -- keyword call latency: dispatch by the dynamic library API ('run_keyword') compared with calling the method directly
+
+sys.path.insert(0, sRepositoryPath)
+from RobotframeworkExtensions.Collection import Collection
+
+oLibrary = Collection()
+nCalls   = oCmdLineArgs.calls
+fTimeDirect, _  = oBenchmark.Measure(lambda: [oLibrary.normalize_path("/a//b") for _ in range(nCalls)], nRepeat=5)
+fTimeDynamic, _ = oBenchmark.Measure(lambda: [oLibrary.run_keyword("Normalize Path", ("/a//b",), {}) for _ in range(nCalls)], nRepeat=5)
+print(f"Keyword call latency (keyword 'normalize_path', best of 5 x {nCalls} calls)")
+oBenchmark.PrintTable(["call", "latency [us]", "overhead [us]"],
+                      [["method call", f"{fTimeDirect / nCalls * 1e6:.2f}", ""],
+                       ["run_keyword (dynamic library API)", f"{fTimeDynamic / nCalls * 1e6:.2f}", f"{(fTimeDynamic - fTimeDirect) / nCalls * 1e6:.2f}"]])
@@ -0,0 +1,100 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_normalize_path_engines.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the path normalization engines of the 'normalize_path' keyword:
+# 1. semantics: both engines have to compute the same results (or raise the same exceptions) for a large number
+#    of randomly generated paths and all combinations of the parameters
+# 2. latency: computation time per call and per type of path (without cache)
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, itertools, os, random, sys
+
+from CBenchmark import CBenchmark
+
+from PythonExtensionsCollection.String.CString import CString
+from RobotframeworkExtensions.CPathNormalizer import CPathNormalizer
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--paths', type=int, default=20000, help='Number of random paths for the comparison of the semantics (optional).')
+oCmdLineParser.add_argument('--calls', type=int, default=20000, help='Number of calls per latency measurement (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+# -- 1. semantics
+
+listParts    = ["a", "b c", "..", ".", "", "x.txt", "$HOME", "${HOME}", "%HOME%", "C:", "\\\\", "//", "/", "\\",
+                "http:", "https:", "file:", "server.com", " ", "'", "\"", "..\\..", "D:\\x", "${UNDEFINED}"]
+listSeps     = ["/", "\\", "//", "\\\\", ""]
+listPrefixes = ["http://", "https://", "http:\\\\", "https:\\\\", "file://///", "\\\\", "//", "C:\\", "/", " \"", "${HOME}/"]
+listArgs     = list(itertools.product([False, True], [None, "/reference/path", "C:\\reference"], [False, True], [False, True], [False, True]))
+
+def Call(oFunction, sPath, tupleArgs):
+   try:
+      return oFunction(sPath, *tupleArgs)
+   except Exception as oException:
+      return type(oException).__name__
+
+oRandom = random.Random(0)
+os.environ.setdefault("HOME", "/home/user")
+nCompared  = 0
+nDifferent = 0
+for _ in range(oCmdLineArgs.paths):
+   sPath = "".join(oRandom.choice(listParts) + oRandom.choice(listSeps) for _ in range(oRandom.randint(1, 7)))
+   if oRandom.random() < 0.3:
+      sPath = oRandom.choice(listPrefixes) + sPath
+   for tupleArgs in listArgs:
+      nCompared = nCompared + 1
+      sExpected = Call(CString.NormalizePath, sPath, tupleArgs)
+      sResult   = Call(CPathNormalizer.NormalizePath, sPath, tupleArgs)
+      if sResult != sExpected:
+         nDifferent = nDifferent + 1
+         print(f"different result: {sPath!r} {tupleArgs}: cstring: {sExpected!r}, native: {sResult!r}")
+
+print(f"Semantics: {nCompared} calls compared, {nDifferent} different results")
+
+# -- 2. latency
+
+dictPaths = {"local path"               : "/bench/run_1//artifacts/../logs\\\\file_1.log",
+             "relative path"            : "artifacts//../logs/file_1.log",
+             "path with env. variable"  : "${HOME}/artifacts/../logs/file_1.log",
+             "local network resource"   : "\\\\server.com\\share//artifacts/../logs",
+             "internet address"         : "http:\\\\server.com\\\\part1//part2\\\\part3/part4",
+             "path with drive letter"   : "C:\\subfolder1///../subfolder2\\\\../subfolder3\\"}
+
+oBenchmark = CBenchmark()
+listRows   = []
+nCalls     = oCmdLineArgs.calls
+for sType, sPath in dictPaths.items():
+   fTimeCString, _ = oBenchmark.Measure(lambda: [CString.NormalizePath(sPath) for _ in range(nCalls)], nRepeat=5)
+   fTimeNative, _  = oBenchmark.Measure(lambda: [CPathNormalizer.NormalizePath(sPath) for _ in range(nCalls)], nRepeat=5)
+   listRows.append([sType, f"{fTimeCString / nCalls * 1e6:.2f}", f"{fTimeNative / nCalls * 1e6:.2f}", f"{fTimeCString / fTimeNative:.1f}x"])
+
+print(f"Latency per call (best of 5 x {nCalls} calls, without cache)")
+oBenchmark.PrintTable(["type of path", "cstring [us]", "native [us]", "speedup"], listRows)
+
+sys.exit(0 if nDifferent == 0 else 1)
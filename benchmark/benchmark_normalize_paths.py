@@ -0,0 +1,74 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_normalize_paths.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the normalization of a list of paths by a robot FOR loop calling 'normalize_path' with one single call
+# of 'normalize_paths'.
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse
+
+from CBenchmark import CBenchmark
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--paths', type=int, default=100000, help='Number of paths to be normalized (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nPaths = oCmdLineArgs.paths
+
+sPathsExpression = "[f'/bench/run_{i % 100}//artifacts/../logs\\\\\\\\file_{i}.log' for i in range(${PATHS})]"
+
+dictSuites = {"FOR loop with normalize_path" : f"""*** Test Cases ***
+NormalizePaths
+    ${{aPaths}}    Evaluate    {sPathsExpression}
+    ${{aResult}}    Create List
+    FOR    ${{sPath}}    IN    @{{aPaths}}
+        ${{sResult}}    rf.extensions.normalize_path    ${{sPath}}
+        Call Method    ${{aResult}}    append    ${{sResult}}
+    END
+""",
+              "normalize_paths" : f"""*** Test Cases ***
+NormalizePaths
+    ${{aPaths}}    Evaluate    {sPathsExpression}
+    ${{aResult}}    rf.extensions.normalize_paths    ${{aPaths}}
+"""}
+
+oBenchmark = CBenchmark()
+listRows   = []
+fReference = None
+for sVariant, sSuite in dictSuites.items():
+   sName   = "normalize_paths_" + sVariant.split()[0].lower()
+   dResult = oBenchmark.RunRobotSuite(sName, sSuite, dVariables={"PATHS" : nPaths})
+   if dResult['nFailed'] > 0:
+      raise Exception(f"Benchmark suite '{sName}' failed")
+   if fReference is None:
+      fReference = dResult['fTime']
+   listRows.append([sVariant, f"{dResult['fTime']:.2f}", f"{fReference / dResult['fTime']:.1f}x", f"{dResult['nOutputSize'] / 1024:.0f}"])
+
+print(f"Normalization of {nPaths} paths")
+oBenchmark.PrintTable(["variant", "robot execution time [s]", "speedup", "output.xml [KiB]"], listRows)
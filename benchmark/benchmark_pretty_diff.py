@@ -0,0 +1,70 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_pretty_diff.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the computation time of the 'pretty_diff' engine (hash based pruning of equal subtrees)
+# with the previous approach: pretty print both data structures and compute the difference of the text.
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, copy, difflib
+
+from CBenchmark import CBenchmark
+
+from RobotframeworkExtensions.CTypeRenderer import CTypeRenderer
+from RobotframeworkExtensions.CTypeDiff import CTypeDiff
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--elements', type=int, default=20000, help='Number of top level dictionary keys (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nElements = oCmdLineArgs.elements
+
+dData1 = {f"key_{nIndex}" : {"values" : list(range(10)), "name" : f"name_{nIndex}", "flags" : {"a" : True, "b" : None}}
+          for nIndex in range(nElements)}
+dData2 = copy.deepcopy(dData1)
+dData2[f"key_{nElements // 2}"]["values"][5] = -1
+dData2[f"key_{nElements - 1}"]["name"] = "changed"
+
+def TextDiff():
+   listLines1 = list(CTypeRenderer().Render(dData1))
+   listLines2 = list(CTypeRenderer().Render(dData2))
+   return [sLine for sLine in difflib.unified_diff(listLines1, listLines2, lineterm="", n=0) if sLine[:1] in "+-"][2:]
+
+def HashDiff():
+   return list(CTypeDiff().Diff(dData1, dData2))
+
+oBenchmark = CBenchmark()
+fTimeText, listText = oBenchmark.Measure(TextDiff, nRepeat=1)
+fTimeHash, listHash = oBenchmark.Measure(HashDiff, nRepeat=3)
+
+print(f"Comparison of two dictionaries with {nElements} keys ({13 * nElements} leaves each), 2 differences")
+oBenchmark.PrintTable(["method", "time [s]", "lines of output", "speedup"],
+                      [["pretty print + text diff", f"{fTimeText:.3f}", len(listText), "1.0x"],
+                       ["pretty_diff (hash pruning)", f"{fTimeHash:.3f}", len(listHash), f"{fTimeText / fTimeHash:.1f}x"]])
+for sLine in listHash:
+   print(sLine)
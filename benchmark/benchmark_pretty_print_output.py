@@ -0,0 +1,101 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_pretty_print_output.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the keyword time of 'pretty_print' and the size of the resulting output.xml
+# between the per line output (default) and the block mode output with several output sinks.
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, os
+
+from CBenchmark import CBenchmark
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--elements', type=int, default=20000, help='Number of list elements to be pretty printed (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nElements = oCmdLineArgs.elements
+
+# the keyword 'pretty_print' of the initial version of the library (reference): output computed by 'CTypePrint',
+# every line logged and written to console by a new 'BuiltIn' instance
+sBaselineLibrary = """
+from robot.api.deco import keyword, library
+from robot.libraries.BuiltIn import BuiltIn
+from PythonExtensionsCollection.Utils.CUtils import CTypePrint
+
+@library
+class baseline_pretty_print(object):
+
+    ROBOT_AUTO_KEYWORDS = False
+
+    @keyword
+    def pretty_print(self, oData=None, sPrefix=None):
+       oTypePrint   = CTypePrint()
+       listOutLines = oTypePrint.TypePrint(oData)
+       for sLine in listOutLines:
+          BuiltIn().log(sLine, "INFO")
+          BuiltIn().log_to_console(sLine)
+       return listOutLines
+"""
+
+sSuiteTemplate = """Library    ${{CURDIR}}/baseline_pretty_print.py    WITH NAME    baseline
+
+*** Test Cases ***
+PrettyPrint
+    ${{aItems}}    Evaluate    [{{'index' : i, 'name' : f'item_{{i}}'}} for i in range(${{ELEMENTS}})]
+    ${{aOutput}}    {sKeyword}
+"""
+
+listVariants = [("initial version (new BuiltIn per line)", "both", "baseline.pretty_print    ${aItems}"),
+                ("per line",                                "both", "rf.extensions.pretty_print    ${aItems}    bBlockMode=False    sSink=both"),
+                ("block",                                   "both", "rf.extensions.pretty_print    ${aItems}    bBlockMode=True    sSink=both"),
+                ("block",                                   "log",  "rf.extensions.pretty_print    ${aItems}    bBlockMode=True    sSink=log"),
+                ("block",                                   "none", "rf.extensions.pretty_print    ${aItems}    bBlockMode=True    sSink=none")]
+
+oBenchmark = CBenchmark()
+with open(os.path.join(oBenchmark.sOutputPath, "baseline_pretty_print.py"), "w", encoding="utf-8") as oFile:
+   oFile.write(sBaselineLibrary)
+
+listRows   = []
+fReference = None
+for nVariant, (sMode, sSink, sKeyword) in enumerate(listVariants):
+   sName   = f"pretty_print_output_{nVariant}_{sSink}"
+   dResult = oBenchmark.RunRobotSuite(sName, sSuiteTemplate.format(sKeyword=sKeyword), dVariables={"ELEMENTS" : nElements})
+   if dResult['nFailed'] > 0:
+      raise Exception(f"Benchmark suite '{sName}' failed")
+   fKeywordTime = sum(fTime for sKeywordName, fTime in dResult['dKeywordTimes'].items() if sKeywordName.lower().replace(" ", "_").endswith("pretty_print"))
+   if fReference is None:
+      fReference = fKeywordTime
+   listRows.append([sMode,
+                    sSink,
+                    f"{fKeywordTime:.3f}",
+                    f"{fReference / fKeywordTime:.1f}x" if fKeywordTime > 0 else "-",
+                    f"{dResult['nOutputSize'] / 1024:.0f}"])
+
+print(f"pretty_print of a list with {nElements} dictionaries ({2 * nElements} output lines)")
+oBenchmark.PrintTable(["mode", "sink", "keyword time [s]", "speedup", "output.xml [KiB]"], listRows)
@@ -0,0 +1,58 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+# **************************************************************************************************************
+#
+# benchmark_pretty_print_parallel.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Compares the rendering time of the 'pretty_print' keyword in serial mode and in parallel mode for top level
+# containers of different sizes (crossover point of the parallel mode; see parameter 'nParallelThreshold').
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, os
+
+from CBenchmark import CBenchmark
+
+from RobotframeworkExtensions.CTypeRenderer import CTypeRenderer
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of processes of the parallel mode (optional).')
+oCmdLineParser.add_argument('--sizes', type=str, default="1000,10000,30000,100000,300000,1000000", help='Comma separated sizes of the top level container (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nProcesses = max(oCmdLineArgs.processes, 2)
+listSizes  = [int(sSize) for sSize in oCmdLineArgs.sizes.split(",")]
+
+oBenchmark = CBenchmark()
+listRows   = []
+for nSize in listSizes:
+   dData = {f"key_{nIndex}" : {"index" : nIndex, "values" : [nIndex, nIndex * 0.5, str(nIndex)]} for nIndex in range(nSize)}
+   fTimeSerial, listSerial     = oBenchmark.Measure(lambda: list(CTypeRenderer().Render(dData)), nRepeat=3)
+   fTimeParallel, listParallel = oBenchmark.Measure(lambda: list(CTypeRenderer().RenderParallel(dData, nProcesses, 0)), nRepeat=3)
+   listRows.append([f"{nSize:,}", f"{len(listSerial):,}", f"{fTimeSerial:.4f}", f"{fTimeParallel:.4f}",
+                    f"{fTimeSerial / fTimeParallel:.2f}x", "yes" if listSerial == listParallel else "NO"])
+
+print(f"Rendering of a dictionary with nested elements: serial mode vs. parallel mode ({nProcesses} processes, {os.cpu_count()} CPUs)")
+oBenchmark.PrintTable(["elements", "lines", "serial [s]", "parallel [s]", "speedup", "identical"], listRows)
@@ -0,0 +1,105 @@
+# **************************************************************************************************************
+#
+#  Copyright 2020-2024 Robert Bosch GmbH
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#
+# benchmark_shared_state.py
+#
+# XC-HWP/ESW3-Queckenstedt
+#
+# Measures the 'normalize_paths' keyword within several robot processes running at the same time (like the
+# processes of pabot) - without shared state, with an empty shared state and with a shared state filled by a previous
+# execution (warm cache; library parameter 'sSharedState').
+#
+# --------------------------------------------------------------------------------------------------------------
+#
+# 17.10.2026
+#
+# --------------------------------------------------------------------------------------------------------------
+
+import argparse, json, os, resource, shutil, subprocess, sys, time
+
+from CBenchmark import CBenchmark, sRepositoryPath
+
+# --------------------------------------------------------------------------------------------------------------
+
+oCmdLineParser = argparse.ArgumentParser()
+oCmdLineParser.add_argument('--workers', type=int, default=8, help='Number of robot processes running at the same time (optional).')
+oCmdLineParser.add_argument('--paths', type=int, default=50000, help='Number of paths normalized by every process (optional).')
+oCmdLineParser.add_argument('--engine', type=str, default="cstring", help='Path normalization engine (optional).')
+oCmdLineArgs = oCmdLineParser.parse_args()
+
+nWorkers = oCmdLineArgs.workers
+nPaths   = oCmdLineArgs.paths
+
+sSuite = """*** Settings ***
+Library    RobotframeworkExtensions.Collection    nPathCacheSize={nPaths}    sPathEngine={sEngine}    bTiming=True{sSharedState}    WITH NAME    rf.extensions
+
+*** Test Cases ***
+NormalizePaths
+    ${{aPaths}}    Evaluate    [f'/bench/run_{{i % 100}}//artifacts/../logs\\\\\\\\file_{{i}}.log' for i in range({nPaths})]
+    ${{aResult}}    rf.extensions.normalize_paths    ${{aPaths}}
+"""
+
+oBenchmark = CBenchmark()
+sBenchmarkPath = os.path.join(oBenchmark.sOutputPath, "shared_state")
+shutil.rmtree(sBenchmarkPath, ignore_errors=True)
+os.makedirs(sBenchmarkPath)
+sDatabaseFile = os.path.join(sBenchmarkPath, "shared_state.sqlite")
+
+def RunWorkers(sVariant=None, bSharedState=False):
+   """
+Starts ``nWorkers`` robot processes at the same time and returns the wall clock time of all processes, the CPU time of all
+processes and the time of the 'normalize_paths' keyword summed up over all processes (seconds).
+
+The processes share the CPUs; in case of less CPUs than processes, the keyword times contain the time waiting for the CPU
+(the CPU time is the better measure in this case).
+   """
+   sVariantPath = os.path.join(sBenchmarkPath, sVariant)
+   sSuiteFile   = os.path.join(sVariantPath, "normalize_paths.robot")
+   os.makedirs(sVariantPath)
+   with open(sSuiteFile, "w", encoding="utf-8") as oSuiteFile:
+      oSuiteFile.write(sSuite.format(nPaths=nPaths, sEngine=oCmdLineArgs.engine,
+                                     sSharedState=f"    sSharedState={sDatabaseFile}" if bSharedState is True else ""))
+   dictEnv = dict(os.environ, PYTHONPATH=os.pathsep.join([sRepositoryPath, os.environ.get("PYTHONPATH", "")]))
+   oUsage = resource.getrusage(resource.RUSAGE_CHILDREN)
+   fStart = time.perf_counter()
+   listProcesses = [subprocess.Popen([sys.executable, "-m", "robot", "--outputdir", os.path.join(sVariantPath, str(nWorker)),
+                                      "--log", "NONE", "--report", "NONE", "--console", "none", sSuiteFile], env=dictEnv)
+                    for nWorker in range(nWorkers)]
+   for oProcess in listProcesses:
+      if oProcess.wait() != 0:
+         raise Exception(f"Benchmark variant '{sVariant}' failed")
+   fTime = time.perf_counter() - fStart
+   oUsageAfter = resource.getrusage(resource.RUSAGE_CHILDREN)
+   fCpuTime = (oUsageAfter.ru_utime - oUsage.ru_utime) + (oUsageAfter.ru_stime - oUsage.ru_stime)
+   fKeywordTime = 0.0
+   for nWorker in range(nWorkers):
+      with open(os.path.join(sVariantPath, str(nWorker), "output_keyword_timing.json"), encoding="utf-8") as oReportFile:
+         fKeywordTime = fKeywordTime + json.load(oReportFile)["keywords"]["normalize_paths"]["total_ms"] / 1000
+   return fTime, fCpuTime, fKeywordTime
+
+listRows   = []
+fReference = None
+for sVariant, bSharedState in (("without shared state", False),
+                               ("shared state (empty)", True),
+                               ("shared state (warm)",  True)):
+   fTime, fCpuTime, fKeywordTime = RunWorkers(sVariant.replace(" ", "_").replace("(", "").replace(")", ""), bSharedState)
+   if fReference is None:
+      fReference = fKeywordTime
+   listRows.append([sVariant, f"{fTime:.2f}", f"{fCpuTime:.2f}", f"{fKeywordTime:.2f}", f"{fReference / fKeywordTime:.1f}x"])
+
+print(f"{nWorkers} robot processes, {nPaths} paths per process, engine '{oCmdLineArgs.engine}'")
+oBenchmark.PrintTable(["variant", "wall clock time [s]", "CPU time [s]", "normalize_paths (all processes) [s]", "speedup (normalize_paths)"], listRows)
@@ -142,21 +142,28 @@ if ( ('install' in listCmdArgs) or ('build' in listCmdArgs) or ('sdist' in listC
     print(COLBY + "Entering extended installation")
     print()
 
-    print(COLBY + "Extended setup step 1/5: Calling the documentation builder")
+    print(COLBY + "Extended setup step 1/6: Calling the documentation builder")
     print()
 
     nReturn = oExtendedSetup.genpackagedoc()
     if nReturn != SUCCESS:
         sys.exit(nReturn)
 
-    print(COLBY + "Extended setup step 2/5: Converting the repository README")
+    print(COLBY + "Extended setup step 2/6: Computing the keyword metadata (package data)")
+    print()
+
+    nReturn = oExtendedSetup.genkeywordmetadata()
+    if nReturn != SUCCESS:
+        sys.exit(nReturn)
+
+    print(COLBY + "Extended setup step 3/6: Converting the repository README")
     print()
 
     nReturn = oExtendedSetup.convert_repo_readme()
     if nReturn != SUCCESS:
         sys.exit(nReturn)
 
-    print(COLBY + "Extended setup step 3/5: Deleting previous setup outputs (build, dist, <package name>.egg-info within repository)")
+    print(COLBY + "Extended setup step 4/6: Deleting previous setup outputs (build, dist, <package name>.egg-info within repository)")
     print()
 
     nReturn = oExtendedSetup.delete_previous_build()
@@ -165,11 +172,11 @@ if ( ('install' in listCmdArgs) or ('build' in listCmdArgs) or ('sdist' in listC
 
     if ( ('bdist_wheel' in listCmdArgs) or ('build' in listCmdArgs) ):
         print()
-        print(COLBY + "Skipping extended setup step 4/5: Deleting previous package installation folder within site-packages")
+        print(COLBY + "Skipping extended setup step 5/6: Deleting previous package installation folder within site-packages")
         print()
     else:
         print()
-        print(COLBY + "Extended setup step 4/5: Deleting previous package installation folder within site-packages") # (<package name> and <package name>_doc under <Python installation>\Lib\site-packages
+        print(COLBY + "Extended setup step 5/6: Deleting previous package installation folder within site-packages") # (<package name> and <package name>_doc under <Python installation>\Lib\site-packages
         print()
         nReturn = oExtendedSetup.delete_previous_installation()
         if nReturn != SUCCESS:
@@ -184,7 +191,7 @@ if ( ('install' in listCmdArgs) or ('build' in listCmdArgs) or ('sdist' in listC
 
 # -- the 'setup' itself
 
-print(COLBY + "Extended setup step 5/5: install.run(self)")
+print(COLBY + "Extended setup step 6/6: install.run(self)")
 print()
 
 setuptools.setup(
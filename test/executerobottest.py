@@ -23,6 +23,10 @@
 # Executes robot tests recursively in current folder.
 # Log file can be set in command line. If not, default log is written.
 # Additional command line for involved framework can also be set in command line (of this script).
+# With '--processes N' the test suites are executed by up to N robot processes in parallel (output files of every suite
+# within 'logfiles/shards'); the results are merged into one log file with rebot.
+# The durations of all suites and tests are kept in '<log file>_durations.json' next to the log file; the suites
+# that took longest in the previous executions are started first.
 #
 # --------------------------------------------------------------------------------------------------------------
 #
@@ -30,7 +34,8 @@
 #
 # --------------------------------------------------------------------------------------------------------------
 
-import os, sys, platform, shlex, subprocess, shutil, argparse
+import os, sys, platform, shlex, subprocess, shutil, argparse, json, time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import colorama as col
 
@@ -91,6 +96,7 @@ print()
 oCmdLineParser = argparse.ArgumentParser()
 oCmdLineParser.add_argument('--logfile', type=str, help='Path and name of XML log file (optional).')
 oCmdLineParser.add_argument('--robotcommandline', type=str, help='Command line for RobotFramework AIO (optional).')
+oCmdLineParser.add_argument('--processes', type=int, help='Number of robot processes executing the test suites in parallel (optional; default: one robot process for all test suites).')
 oCmdLineArgs = oCmdLineParser.parse_args()
 
 sLogFile = None
@@ -104,6 +110,13 @@ sRobotCommandLine = None
 if oCmdLineArgs.robotcommandline is not None:
    sRobotCommandLine = oCmdLineArgs.robotcommandline
 
+nProcesses = None
+if oCmdLineArgs.processes is not None:
+   nProcesses = oCmdLineArgs.processes
+   if nProcesses < 1:
+      printerror(f"Invalid number of processes {nProcesses}. Expected value >= 1")
+      sys.exit(ERROR)
+
 # -- create the log file folder
 
 oLogFile = CFile(sLogFile)
@@ -121,40 +134,254 @@ if bSuccess is not True:
 print(sResult)
 print()
 
-# -- prepare the command line for the test execution
-
-listCmdLineParts = []
-listCmdLineParts.append(f"\"{sPython}\"")
-listCmdLineParts.append("-m robot")
-if sRobotCommandLine is not None:
-   listCmdLineParts.append(f"{sRobotCommandLine}")
-listCmdLineParts.append(f"-d \"{sLogFilePath}\"")
-listCmdLineParts.append(f"-o \"{sLogFileName}\"")
-listCmdLineParts.append(f"-l \"{sLogFileNameOnly}_log.html\"")
-listCmdLineParts.append(f"-r \"{sLogFileNameOnly}_report.html\"")
-listCmdLineParts.append(f"-b \"{sLogFileNameOnly}.log\"")
-listCmdLineParts.append(f"\"{sThisScriptPath}\"")
-sCmdLine = " ".join(listCmdLineParts)
-del listCmdLineParts
-
-# -- execute the tests
-
-print(f"Now executing command line:\n{sCmdLine}")
-print()
+# -- durations of suites and tests (history of previous test executions, timing summary)
+
+sDurationsFile = f"{sLogFilePath}/{sLogFileNameOnly}_durations.json"
+
+# number of tests listed in the timing summary
+NROFSLOWESTTESTS = 10
+
+def GetSuiteKey(sSuite=None):
+   """
+Returns the key of the suite ``sSuite`` (path of the suite file or folder) within the durations: the path relative to this script.
+   """
+   return os.path.relpath(CString.NormalizePath(sSuite), sThisScriptPath).replace("\\", "/")
+
+def LoadDurations():
+   """
+Returns the durations of the previous test executions (in seconds; empty in case of no history): durations of the suites,
+durations of the tests and wall clock times of the test executions (``serial`` or number of robot processes -> seconds).
+   """
+   try:
+      with open(sDurationsFile, "r", encoding="utf-8") as oDurationsFile:
+         dictDurations = json.load(oDurationsFile)
+      return dictDurations.get("suites", {}), dictDurations.get("tests", {}), dictDurations.get("executions", {})
+   except (OSError, ValueError):
+      return {}, {}, {}
+
+def ReadDurations(sOutputFile=None):
+   """
+Returns the durations of the top level suites (key of the suite -> seconds) and of all tests (full name -> seconds) of the
+robot output file ``sOutputFile`` (keywords are not read).
+   """
+   from robot.api import ExecutionResult
+   oResult = ExecutionResult(sOutputFile, include_keywords=False)
+   # suites without tests (e.g. no tests matching the command line, '--runemptysuite') do not overwrite the durations of previous executions
+   dictSuiteDurations = {GetSuiteKey(str(oSuite.source)) : oSuite.elapsed_time.total_seconds() for oSuite in oResult.suite.suites
+                         if (oSuite.source is not None) and (oSuite.test_count > 0)}
+   dictTestDurations  = {oTest.full_name : oTest.elapsed_time.total_seconds() for oTest in oResult.suite.all_tests}
+   return dictSuiteDurations, dictTestDurations
+
+def UpdateDurations(dictSuiteDurations=None, dictTestDurations=None, fWallClockTime=None):
+   """
+Adds the durations of this test execution to the history (suites and tests not executed this time keep their previous durations).
+The wall clock time ``fWallClockTime`` is not stored in case of ``None``.
+Returns the wall clock time of the previous serial test execution (``None`` in case of no serial test execution so far).
+   """
+   dictSuiteHistory, dictTestHistory, dictExecutionHistory = LoadDurations()
+   fSerialWallClockTime = dictExecutionHistory.get("serial")
+   dictSuiteHistory.update(dictSuiteDurations)
+   dictTestHistory.update(dictTestDurations)
+   if fWallClockTime is not None:
+      dictExecutionHistory["serial" if nProcesses is None else str(nProcesses)] = fWallClockTime
+   with open(sDurationsFile, "w", encoding="utf-8") as oDurationsFile:
+      json.dump({"suites" : dictSuiteHistory, "tests" : dictTestHistory, "executions" : dictExecutionHistory}, oDurationsFile, indent=1, sort_keys=True)
+   return fSerialWallClockTime
+
+def PrintTimingSummary(dictSuiteDurations=None, dictTestDurations=None, fWallClockTime=None, fSerialWallClockTime=None):
+   """
+Prints the slowest tests of this test execution, the wall clock time of this test execution and the speedup against a serial
+test execution: the previous serial test execution (``fSerialWallClockTime``) or - if not available - the sum of the durations
+of all suites (estimation; in case of parallel test executions on less CPUs than processes the durations contain the time
+waiting for the CPU).
+   """
+   listSlowestTests = sorted(dictTestDurations.items(), key=lambda tupleTest: tupleTest[1], reverse=True)[:NROFSLOWESTTESTS]
+   nWidth = max([len("test")] + [len(sTest) for sTest, _ in listSlowestTests])
+   print("Timing summary")
+   print()
+   print(f"{'test'.ljust(nWidth)} | duration [s]")
+   print(f"{'-' * nWidth}-+-------------")
+   for sTest, fDuration in listSlowestTests:
+      print(f"{sTest.ljust(nWidth)} | {fDuration:.3f}")
+   print()
+   print(f"wall clock time                    : {fWallClockTime:.3f} s ({'serial' if nProcesses is None else f'{nProcesses} robot processes'})")
+   if nProcesses is not None:
+      if fSerialWallClockTime is not None:
+         print(f"wall clock time (serial, previous) : {fSerialWallClockTime:.3f} s")
+      else:
+         fSerialWallClockTime = sum(dictSuiteDurations.values())
+         print(f"sum of suite durations (estimated) : {fSerialWallClockTime:.3f} s")
+      print(f"speedup against serial             : {fSerialWallClockTime / fWallClockTime:.2f}x")
+   print()
 
-listCmdLineParts = shlex.split(sCmdLine)
+# -- parallel execution (command line parameter '--processes')
+
+def GetSuites(sTestPath=None, listExcludedPaths=None):
+   """
+Returns the top level suites within ``sTestPath`` in the order of the robot framework: the files ``*.robot`` and the folders
+containing such files. Names starting with ``_`` or ``.`` are ignored (like the robot framework does).
+   """
+   listSuites = []
+   for sName in sorted(os.listdir(sTestPath), key=lambda sName: sName.lower()):
+      sPath = CString.NormalizePath(f"{sTestPath}/{sName}")
+      if sName.startswith(("_", ".")) or (sPath in listExcludedPaths):
+         continue
+      if os.path.isfile(sPath):
+         if sName.lower().endswith(".robot") and (os.path.splitext(sName)[0].lower() != "__init__"):
+            listSuites.append(sPath)
+      elif os.path.isdir(sPath):
+         for _, _, listFileNames in os.walk(sPath):
+            if any(sFileName.lower().endswith(".robot") for sFileName in listFileNames):
+               listSuites.append(sPath)
+               break
+   return listSuites
+
+def ExecuteSuite(sSuite=None, sOutputPath=None):
+   """
+Executes the suite ``sSuite`` in a separate robot process (output files within ``sOutputPath``; no log and no report).
+Returns the return value of the robot process and its console output.
+   """
+   listCmdLineParts = [sPython, "-m", "robot"]
+   if sRobotCommandLine is not None:
+      listCmdLineParts.extend(shlex.split(sRobotCommandLine))
+   # '--runemptysuite': suites without tests matching the command line are part of the merged results (as in case of one robot process)
+   listCmdLineParts.extend(["--runemptysuite", "-d", sOutputPath, "-o", "output.xml", "-l", "NONE", "-r", "NONE", "-b", f"{sLogFileNameOnly}.log", sSuite])
+   oProcess = subprocess.run(listCmdLineParts, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+   return oProcess.returncode, oProcess.stdout
 
-nReturn = ERROR
-try:
-   nReturn = subprocess.call(listCmdLineParts)
+# --------------------------------------------------------------------------------------------------------------
+
+# -- the log file of an earlier test execution must not be taken for the results of this test execution
+def GetFileSignature(sFile=None):
+   """
+Returns the modification time, size and inode of the file ``sFile`` (``None`` in case of the file does not exist).
+   """
+   try:
+      oStat = os.stat(sFile)
+      return (oStat.st_mtime_ns, oStat.st_size, oStat.st_ino)
+   except OSError:
+      return None
+
+tupleLogFileSignature = GetFileSignature(sLogFile)
+fStartTime = time.perf_counter()
+
+if nProcesses is None:
+   # -- prepare the command line for the test execution
+
+   listCmdLineParts = []
+   listCmdLineParts.append(f"\"{sPython}\"")
+   listCmdLineParts.append("-m robot")
+   if sRobotCommandLine is not None:
+      listCmdLineParts.append(f"{sRobotCommandLine}")
+   listCmdLineParts.append(f"-d \"{sLogFilePath}\"")
+   listCmdLineParts.append(f"-o \"{sLogFileName}\"")
+   listCmdLineParts.append(f"-l \"{sLogFileNameOnly}_log.html\"")
+   listCmdLineParts.append(f"-r \"{sLogFileNameOnly}_report.html\"")
+   listCmdLineParts.append(f"-b \"{sLogFileNameOnly}.log\"")
+   listCmdLineParts.append(f"\"{sThisScriptPath}\"")
+   sCmdLine = " ".join(listCmdLineParts)
+   del listCmdLineParts
+
+   # -- execute the tests
+
+   print(f"Now executing command line:\n{sCmdLine}")
    print()
-   print(f"[{sThisScriptName}] : Subprocess ROBOT returned {nReturn}")
-except Exception as ex:
+
+   listCmdLineParts = shlex.split(sCmdLine)
+
+   nReturn = ERROR
+   try:
+      nReturn = subprocess.call(listCmdLineParts)
+      print()
+      print(f"[{sThisScriptName}] : Subprocess ROBOT returned {nReturn}")
+   except Exception as ex:
+      print()
+      printexception(str(ex))
+      print()
+      sys.exit(ERROR)
    print()
-   printexception(str(ex))
+else:
+   # -- execute every suite in a separate robot process (up to nProcesses at the same time); each process has its own output folder
+   sShardsPath = f"{sLogFilePath}/shards"
+   shutil.rmtree(sShardsPath, ignore_errors=True)
+   listSuites = GetSuites(sThisScriptPath, [sLogFilePath])
+   if len(listSuites) == 0:
+      printerror(f"No test suites found in '{sThisScriptPath}'")
+      sys.exit(ERROR)
+   dictOutputPaths = {sSuite : f"{sShardsPath}/{nIndex + 1:03d}_{os.path.splitext(os.path.basename(sSuite))[0]}" for nIndex, sSuite in enumerate(listSuites)}
+
+   # -- longest processing time first: the suites that took longest in the previous executions are started first
+   #    (suites without history are started at the very beginning; their durations are unknown)
+   dictSuiteHistory, _, _ = LoadDurations()
+   listScheduledSuites = sorted(listSuites, key=lambda sSuite: -dictSuiteHistory.get(GetSuiteKey(sSuite), float("inf")))
+
+   print(f"Now executing {len(listSuites)} test suites with {nProcesses} robot processes (order of execution: longest suites first)")
    print()
-   sys.exit(ERROR)
-print()
+   for sSuite in listScheduledSuites:
+      fDuration = dictSuiteHistory.get(GetSuiteKey(sSuite))
+      print(f"* {GetSuiteKey(sSuite)} ({'unknown duration' if fDuration is None else f'{fDuration:.3f} s'})")
+   print()
+
+   dictReturns = {}
+   try:
+      with ThreadPoolExecutor(max_workers=nProcesses) as oExecutor:
+         dictFutures = {oExecutor.submit(ExecuteSuite, sSuite, dictOutputPaths[sSuite]) : sSuite for sSuite in listScheduledSuites}
+         for oFuture in as_completed(dictFutures):
+            sSuite = dictFutures[oFuture]
+            nSuiteReturn, sConsoleOutput = oFuture.result()
+            dictReturns[sSuite] = nSuiteReturn
+            print(sConsoleOutput)
+            print(f"[{sThisScriptName}] : Subprocess ROBOT ({os.path.basename(sSuite)}) returned {nSuiteReturn}")
+            print()
+   except Exception as ex:
+      print()
+      printexception(str(ex))
+      print()
+      sys.exit(ERROR)
+
+   # -- merge the results of all processes into one log file (in the order of the suites, like in case of one robot process)
+   from robot.running import TestSuite
+   listOutputFiles = [f"{dictOutputPaths[sSuite]}/output.xml" for sSuite in listSuites if os.path.isfile(f"{dictOutputPaths[sSuite]}/output.xml")]
+   listCmdLineParts = [sPython, "-m", "robot.rebot", "--name", TestSuite.name_from_source(sThisScriptPath),
+                       "-d", sLogFilePath, "-o", sLogFileName, "-l", f"{sLogFileNameOnly}_log.html", "-r", f"{sLogFileNameOnly}_report.html"]
+   listCmdLineParts.extend(listOutputFiles)
+
+   print(f"Now executing command line:\n{' '.join(listCmdLineParts)}")
+   print()
+
+   nReturn = ERROR
+   try:
+      if len(listOutputFiles) > 0:
+         nReturn = subprocess.call(listCmdLineParts)
+         print()
+         print(f"[{sThisScriptName}] : Subprocess REBOT returned {nReturn}")
+      # robot processes failed without results (e.g. invalid command line or data): a robot error like in case of one robot process
+      nReturn = max([nReturn] + [nSuiteReturn for nSuiteReturn in dictReturns.values() if nSuiteReturn > 250])
+   except Exception as ex:
+      print()
+      printexception(str(ex))
+      print()
+      sys.exit(ERROR)
+   print()
+
+fWallClockTime = time.perf_counter() - fStartTime
+
+# -- durations of suites and tests: only of test executions with results (no robot error, log file written by this test execution,
+#    tests executed). Further robot options may select a part of the tests; in this case only the durations of the tests are kept
+#    (the durations of the suites and the wall clock time would be too short). Problems with the durations are no errors of the test execution.
+
+if (nReturn <= 250) and (GetFileSignature(sLogFile) not in (None, tupleLogFileSignature)):
+   try:
+      dictSuiteDurations, dictTestDurations = ReadDurations(sLogFile)
+      if len(dictTestDurations) > 0:
+         bAllTests = sRobotCommandLine is None
+         fSerialWallClockTime = UpdateDurations(dictSuiteDurations if bAllTests is True else {}, dictTestDurations,
+                                                fWallClockTime if bAllTests is True else None)
+         PrintTimingSummary(dictSuiteDurations, dictTestDurations, fWallClockTime, fSerialWallClockTime if bAllTests is True else None)
+   except Exception as ex:
+      print()
+      print(COLBY + f"Warning: durations of suites and tests not updated ({ex})")
+      print()
 
 if nReturn == SUCCESS:
    print(f"Test results in '{sLogFile}'")